@@ -0,0 +1,66 @@
+# Compare page-load time and browser memory between the default and lean browser profiles.
+#
+# Usage: python bench/browser_profile.py [--url URL] [--loads N]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from rich.console import Console
+from rich.table import Table
+
+from browser import driver_rss, new_driver
+
+# Define the page to load; without a session it redirects to the Stanford login page, which is what the bot loads most
+DEFAULT_URL = "https://simpleenroll.stanford.edu/SimpleEnroll/index"
+
+
+def measure(lean, url, loads):
+    # Load the page several times and return the load times (in seconds) and the peak memory (in bytes).
+    driver = new_driver(lean=lean)
+    times = []
+    peak = 0
+    try:
+        for _ in range(loads):
+            # Start from a blank page so every load is a full navigation.
+            driver.get("about:blank")
+            start = time.perf_counter()
+            driver.get(url)
+            times.append(time.perf_counter() - start)
+            peak = max(peak, driver_rss(driver) or 0)
+    finally:
+        driver.quit()
+    return times, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the default and lean browser profiles")
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--loads", type=int, default=5)
+    args = parser.parse_args()
+
+    table = Table(title=f"{args.loads} loads of {args.url}")
+    table.add_column("Profile")
+    table.add_column("Median load", justify="right")
+    table.add_column("Max load", justify="right")
+    table.add_column("Peak RSS", justify="right")
+
+    results = {}
+    for name, lean in [("default", False), ("lean", True)]:
+        times, peak = measure(lean, args.url, args.loads)
+        results[name] = (statistics.median(times), peak)
+        table.add_row(name, f"{statistics.median(times) * 1000:.0f} ms", f"{max(times) * 1000:.0f} ms",
+                      f"{peak / 2 ** 20:.0f} MiB")
+
+    (default_time, default_rss), (lean_time, lean_rss) = results["default"], results["lean"]
+    table.add_row("savings", f"{(1 - lean_time / default_time) * 100:.0f}%", "",
+                  f"{(1 - lean_rss / default_rss) * 100:.0f}%" if default_rss else "n/a")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
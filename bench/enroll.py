@@ -0,0 +1,151 @@
+# Drive the bot against the local mock Simple Enroll server and report how fast it runs.
+#
+# For each combination of planned course count and server delay, a fresh mock server and bot are started, and
+# the following are measured:
+#   - attempt latency and cycles per minute, running cycles back to back
+#   - time to detect a freed seat, from a seat opening at a random moment while polling every --interval seconds
+#     until the bot sees itself enrolled
+#   - browser and Python memory
+#
+# Usage: python bench/enroll.py [--courses 4,20,100] [--delays 0,0.2] [--cycles N] [--interval SECONDS]
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from rich.console import Console
+from rich.table import Table
+
+import bot as bot_module
+from browser import driver_rss
+from display import Display
+from metrics import Metrics
+from mock_server import MockServer, MockState
+from scheduler import FixedScheduler
+
+# Define how long to wait for the bot to notice a freed seat before giving up (in seconds)
+DETECT_TIMEOUT = 120
+
+
+def python_rss():
+    # Return the peak resident memory of this process (in bytes), or None where it can't be read.
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(planned, delay, args):
+    # Run one bot against a fresh mock server and return its measurements.
+    state = MockState(enrolled=args.enrolled, planned=planned, delay=delay, page_delay=args.page_delay,
+                      session_lifetime=args.session_lifetime)
+    with MockServer(state) as server, tempfile.TemporaryDirectory() as data_dir:
+        # Point the bot at the mock server instead of the live site.
+        bot_module.url = server.url()
+
+        bot = bot_module.Bot("mock", "mock", engine=args.engine, scheduler=FixedScheduler(0), data_dir=data_dir,
+                             lean=args.lean, display=Display(), metrics=Metrics(enabled=True))
+        try:
+            bot.start()
+
+            # Run cycles back to back while every planned course is full.
+            latencies = []
+            start = time.perf_counter()
+            for _ in range(args.cycles):
+                cycle_start = time.perf_counter()
+                bot.cycle()
+                latencies.append(time.perf_counter() - cycle_start)
+            elapsed = time.perf_counter() - start
+
+            # Free a seat at a random moment while the bot polls at the given interval, and time how long it
+            # takes until the bot's course registry reports the enrollment.
+            target = state.planned()[0]
+            seen = threading.Event()
+            bot.courses.subscribe(
+                lambda change: change.kind == "enrolled" and change.course.class_number == target.class_number
+                and seen.set())
+            bot.scheduler = FixedScheduler(args.interval)
+            threading.Timer(random.uniform(0, args.interval), state.free_seat, (target.class_number,)).start()
+
+            deadline = time.time() + DETECT_TIMEOUT
+            while not seen.is_set() and time.time() < deadline:
+                bot.cycle()
+                if not seen.is_set():
+                    bot.wait()
+            detected = time.time() if seen.is_set() else None
+
+            freed = state.freed.get(target.class_number)
+            enrolled = state.enrolled_at.get(target.class_number)
+            return {
+                "latency": statistics.median(latencies),
+                "latency_max": max(latencies),
+                "cycles_per_minute": args.cycles / elapsed * 60,
+                "enrolled_after": enrolled - freed if enrolled and freed else None,
+                "detected_after": detected - freed if detected and freed else None,
+                "browser_rss": driver_rss(bot.driver),
+                "python_rss": python_rss(),
+                "requests": dict(state.requests),
+            }
+        finally:
+            if bot.http is not None:
+                bot.http.close()
+            bot.driver.quit()
+
+
+def seconds(value):
+    return "timeout" if value is None else f"{value * 1000:.0f} ms" if value < 10 else f"{value:.1f} s"
+
+
+def mebibytes(value):
+    return "n/a" if value is None else f"{value / 2 ** 20:.0f} MiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the bot against a local mock Simple Enroll server")
+    parser.add_argument("--courses", default="4,20,100", help="comma separated planned course counts")
+    parser.add_argument("--delays", default="0,0.2", help="comma separated server delays (in seconds)")
+    parser.add_argument("--enrolled", type=int, default=4, help="number of enrolled courses")
+    parser.add_argument("--page-delay", type=float, default=0.0, help="seconds added to every page load")
+    parser.add_argument("--session-lifetime", type=float, default=3600,
+                        help="seconds before the mock expires a session, to include re-logins")
+    parser.add_argument("--cycles", type=int, default=20, help="back to back cycles to time")
+    parser.add_argument("--interval", type=float, default=5, help="polling interval while waiting for a seat")
+    parser.add_argument("--engine", choices=["browser", "http"], default="browser")
+    parser.add_argument("--lean", action="store_true")
+    args = parser.parse_args()
+
+    table = Table(title=f"Bot against the mock server ({args.engine} engine, {args.enrolled} enrolled, "
+                        f"polling every {args.interval:g}s for the freed seat)")
+    table.add_column("Planned", justify="right")
+    table.add_column("Delay", justify="right")
+    table.add_column("Attempt (median)", justify="right")
+    table.add_column("Attempt (max)", justify="right")
+    table.add_column("Cycles/min", justify="right")
+    table.add_column("Seat enrolled", justify="right")
+    table.add_column("Seat detected", justify="right")
+    table.add_column("Browser RSS", justify="right")
+    table.add_column("Python RSS", justify="right")
+    table.add_column("Requests", justify="left")
+
+    for planned in [int(n) for n in args.courses.split(",")]:
+        for delay in [float(d) for d in args.delays.split(",")]:
+            result = measure(planned, delay, args)
+            table.add_row(str(planned), f"{delay * 1000:.0f} ms", seconds(result["latency"]),
+                          seconds(result["latency_max"]), f"{result['cycles_per_minute']:.0f}",
+                          seconds(result["enrolled_after"]), seconds(result["detected_after"]),
+                          mebibytes(result["browser_rss"]), mebibytes(result["python_rss"]),
+                          ", ".join(f"{k} {v}" for k, v in result["requests"].items()))
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
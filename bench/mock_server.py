@@ -0,0 +1,389 @@
+# A local stand-in for Simple Enroll, for measuring and testing the bot without the live Stanford site.
+#
+# It serves a page exposing SE_EnrolledCourseSet, SE_PlannedCourseSet and SE_NetworkEndpoint.executeRequest,
+# answers SE_BATCHENROLL and SE_EXECUTE_ENROLL requests with SOAP responses, redirects to a login form
+# without a session and expires sessions after a while.
+#
+# Usage: python bench/mock_server.py [--port N] [--enrolled N] [--planned N] [--delay SECONDS]
+import argparse
+import html
+import json
+import secrets
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape, quoteattr
+
+# Define the paths the mock serves, mirroring the real site
+INDEX_PATH = "/SimpleEnroll/index"
+ENDPOINT_PATH = "/SimpleEnroll/endpoint"
+LOGIN_PATH = "/idp/profile/SAML2/Redirect/SSO"
+
+# Define the session cookie name
+SESSION_COOKIE = "JSESSIONID"
+
+# Define the first class number handed out to generated courses
+FIRST_CLASS_NUMBER = 10000
+
+# Weekdays and hours used to give generated courses meeting times that don't overlap
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri"]
+HOURS = range(8, 22)
+SLOTS = len(WEEKDAYS) * len(HOURS)
+
+# Define the term the generated courses meet in
+TERM_START = date(2026, 9, 21)
+TERM_END = date(2026, 12, 4)
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>SimpleEnroll</title></head>
+<body>
+<h1>SimpleEnroll (mock)</h1>
+<script>
+function SE_EnrolledCourseSet() {{}}
+SE_EnrolledCourseSet.prototype.courses = {enrolled};
+function SE_PlannedCourseSet() {{}}
+SE_PlannedCourseSet.prototype.courses = {planned};
+
+function escapeXml(text) {{
+  return text.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+}}
+
+var SE_NetworkEndpoint = {{
+  executeRequest: function (requestType, payload, callback) {{
+    var xhr = new XMLHttpRequest();
+    xhr.open("POST", "{endpoint}");
+    xhr.setRequestHeader("Content-Type", "text/xml; charset=utf-8");
+    xhr.onload = function () {{
+      callback(xhr.responseXML, xhr.status);
+    }};
+    xhr.send(
+      '<?xml version="1.0" encoding="UTF-8"?><Envelope><Body><Request>' +
+      "<RequestType>" + requestType + "</RequestType>" +
+      "<Payload>" + escapeXml(payload) + "</Payload>" +
+      "</Request></Body></Envelope>"
+    );
+  }},
+}};
+</script>
+</body>
+</html>
+"""
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Stanford Login (mock)</title></head>
+<body>
+<form method="post" action="{action}">
+<input name="username" type="text">
+<input name="password" type="password">
+<button name="_eventId_proceed" type="submit">Login</button>
+</form>
+</body>
+</html>
+"""
+
+
+class MockCourse:
+    def __init__(self, index, enrolled, seats=0, blocks=1):
+        # A generated course, meeting once a week in its own slot so no two courses conflict. With more
+        # courses than weekly slots, the term is split into blocks of dates and each block reuses the slots.
+        self.class_number = FIRST_CLASS_NUMBER + index
+        self.subject = "MOCK"
+        self.course_number = str(100 + index)
+        self.enrolled = enrolled
+        self.seats = seats
+        self.career = "UG"
+
+        day = WEEKDAYS[index % len(WEEKDAYS)]
+        hour = HOURS[index // len(WEEKDAYS) % len(HOURS)]
+        block = index // SLOTS
+        length = ((TERM_END - TERM_START).days + 1) // blocks
+        start = TERM_START + timedelta(days=block * length)
+        self.entry = {
+            "daysText": day,
+            "startDate": start.isoformat(),
+            "endDate": (TERM_END if block == blocks - 1 else start + timedelta(days=length - 1)).isoformat(),
+            "startTime": f"{hour}:00",
+            "endTime": f"{hour}:50",
+            "room": f"Room {index}",
+        }
+
+    def name(self):
+        return f"{self.subject} {self.course_number}"
+
+    def to_page(self):
+        # Return the course as the page's course set objects look.
+        return {
+            "psId": str(self.class_number),
+            "courseTitle": f"Mock Course {self.course_number}",
+            "subject": self.subject,
+            "courseNum": self.course_number,
+            "instructors": "Staff",
+            "isPlanned": not self.enrolled,
+            "status": "E" if self.enrolled else "P",
+            "componentCode": "LEC",
+            "careerCode": self.career,
+            "classNbr": self.class_number,
+            "gradingBasis": "GRD",
+            "units": "3",
+            "scheduleEntries": [self.entry],
+        }
+
+
+class MockState:
+    def __init__(self, enrolled=4, planned=4, seats=0, delay=0.0, page_delay=0.0, session_lifetime=3600,
+                 errors=None):
+        # The courses, sessions and settings of the mock site, shared by every request handler.
+        #
+        # Planned courses start with `seats` open seats; errors maps a class number to an error message
+        # that is always returned for it (e.g. a prerequisite error). delay and page_delay are added to
+        # every endpoint response and page load (in seconds).
+        self.lock = threading.Lock()
+        self.courses = {}
+        blocks = max(1, -(-(enrolled + planned) // SLOTS))
+        for i in range(enrolled + planned):
+            course = MockCourse(i, enrolled=i < enrolled, seats=0 if i < enrolled else seats, blocks=blocks)
+            self.courses[course.class_number] = course
+
+        self.delay = delay
+        self.page_delay = page_delay
+        self.session_lifetime = session_lifetime
+        self.errors = dict(errors or {})
+        self.sessions = {}
+
+        # Count what the bot asked for
+        self.requests = {"page": 0, "probe": 0, "endpoint": 0, "login": 0}
+
+        # When each class last had a seat freed, and when it was then enrolled
+        self.freed = {}
+        self.enrolled_at = {}
+
+    def planned(self):
+        return [course for course in self.courses.values() if not course.enrolled]
+
+    def new_session(self):
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[token] = time.time() + self.session_lifetime
+        return token
+
+    def valid(self, token):
+        with self.lock:
+            return token is not None and self.sessions.get(token, 0) > time.time()
+
+    def expire_sessions(self):
+        # Expire every session, as if the site logged everyone out.
+        with self.lock:
+            self.sessions.clear()
+
+    def free_seat(self, class_number, seats=1):
+        # Open seats in a class and remember when, so the time until the bot enrolls can be measured.
+        with self.lock:
+            self.courses[class_number].seats += seats
+            self.freed[class_number] = time.time()
+
+    def enroll(self, course):
+        # Try to enroll in a course, returning an error message or None. Must hold the lock.
+        if course.class_number in self.errors:
+            return self.errors[course.class_number]
+        if course.enrolled:
+            return f"You are already enrolled in {course.name()}."
+        if course.seats <= 0:
+            return f"Class {course.name()} is full.<br>You may add yourself to the wait list."
+        course.seats -= 1
+        course.enrolled = True
+        self.enrolled_at[course.class_number] = time.time()
+        return None
+
+    def execute(self, request_type, payload):
+        # Run an enrollment request and return the SOAP response.
+        payload = ET.fromstring(f"<Payload>{payload}</Payload>")
+        errors, classes = [], []
+
+        with self.lock:
+            if request_type == "SE_BATCHENROLL":
+                courses = [course for course in self.planned() if course.career == payload.findtext("Career")]
+            elif request_type == "SE_EXECUTE_ENROLL":
+                course = self.courses.get(int(payload.findtext("ClassNumber") or 0))
+                courses = [course] if course else []
+                if course is None:
+                    errors.append(("", "Class not found."))
+            else:
+                courses = []
+                errors.append(("", f"Unknown request type {request_type}."))
+
+            for course in courses:
+                error = self.enroll(course)
+                if error:
+                    errors.append((course.name(), error))
+                    continue
+                classes.append(course)
+
+                # Swap out of, or drop, the other class once the enrollment went through.
+                other = int(payload.findtext("SwapWithClassNbr") or 0) or int(payload.findtext("DropifEnroll") or 0)
+                if other in self.courses:
+                    self.courses[other].enrolled = False
+
+        return ("<STF_SE><Errors>"
+                + "".join(f"<Error Subject={quoteattr(subject)} Type=\"E\">{escape(message)}</Error>"
+                          for subject, message in errors)
+                + "</Errors><Classes>"
+                + "".join(f"<Class Subject={quoteattr(course.name())} ClassNbr=\"{course.class_number}\" Status=\"E\"/>"
+                          for course in classes)
+                + "</Classes></STF_SE>")
+
+    def page(self):
+        with self.lock:
+            enrolled = [course.to_page() for course in self.courses.values() if course.enrolled]
+            planned = [course.to_page() for course in self.courses.values() if not course.enrolled]
+        return PAGE.format(enrolled=json.dumps(enrolled), planned=json.dumps(planned), endpoint=ENDPOINT_PATH)
+
+
+class Handler(BaseHTTPRequestHandler):
+    # Keep connections alive, like the real site, so the HTTP engine can reuse them.
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def session(self):
+        # Return the request's session token, if any.
+        for part in self.headers.get("Cookie", "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE:
+                return value
+        return None
+
+    def send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def redirect(self, location, headers=None):
+        self.send(302, headers={"Location": location, **(headers or {})})
+
+    def do_HEAD(self):
+        # The bot's session probe.
+        self.state.requests["probe"] += 1
+        if urlsplit(self.path).path == INDEX_PATH and self.state.valid(self.session()):
+            self.send(200)
+        else:
+            self.redirect(LOGIN_PATH)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == INDEX_PATH:
+            if not self.state.valid(self.session()):
+                self.redirect(LOGIN_PATH + "?execution=e1s2")
+                return
+            self.state.requests["page"] += 1
+            time.sleep(self.state.page_delay)
+            self.send(200, self.state.page().encode())
+        elif path == LOGIN_PATH:
+            self.send(200, LOGIN_PAGE.format(action=html.escape(LOGIN_PATH)).encode())
+        elif path == "/_mock/state":
+            with self.state.lock:
+                state = {
+                    "requests": self.state.requests,
+                    "courses": {course.name(): {"class_number": course.class_number, "enrolled": course.enrolled,
+                                                "seats": course.seats} for course in self.state.courses.values()},
+                }
+            self.send(200, json.dumps(state).encode(), "application/json")
+        else:
+            self.send(404)
+
+    def do_POST(self):
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+
+        if parts.path == LOGIN_PATH:
+            # Accept any credentials and start a session.
+            self.state.requests["login"] += 1
+            token = self.state.new_session()
+            self.redirect(INDEX_PATH, {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+        elif parts.path == ENDPOINT_PATH:
+            self.state.requests["endpoint"] += 1
+            if not self.state.valid(self.session()):
+                self.redirect(LOGIN_PATH)
+                return
+            time.sleep(self.state.delay)
+            request = ET.fromstring(body).find(".//Request")
+            response = self.state.execute(request.findtext("RequestType"), request.findtext("Payload") or "")
+            self.send(200, response.encode(), "text/xml; charset=utf-8")
+        elif parts.path == "/_mock/free":
+            query = parse_qs(parts.query)
+            self.state.free_seat(int(query["class"][0]), int(query.get("seats", ["1"])[0]))
+            self.send(204)
+        elif parts.path == "/_mock/expire":
+            self.state.expire_sessions()
+            self.send(204)
+        else:
+            self.send(404)
+
+
+class MockServer:
+    def __init__(self, state=None, host="127.0.0.1", port=0):
+        # Serve the mock site from a background thread; port 0 picks a free port.
+        self.state = state or MockState()
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.server.state = self.state
+        self.thread = None
+
+    def url(self, path=INDEX_PATH):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="mock-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for Simple Enroll")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--enrolled", type=int, default=4, help="number of enrolled courses")
+    parser.add_argument("--planned", type=int, default=4, help="number of planned courses")
+    parser.add_argument("--seats", type=int, default=0, help="open seats in each planned course")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds added to every enrollment response")
+    parser.add_argument("--page-delay", type=float, default=0.0, help="seconds added to every page load")
+    parser.add_argument("--session-lifetime", type=float, default=3600, help="seconds before a session expires")
+    args = parser.parse_args()
+
+    state = MockState(args.enrolled, args.planned, args.seats, args.delay, args.page_delay, args.session_lifetime)
+    server = MockServer(state, port=args.port)
+    print(f"Serving mock Simple Enroll at {server.url()}")
+    print("POST /_mock/free?class=N to free a seat, /_mock/expire to expire all sessions, GET /_mock/state to inspect")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Benchmark the streaming SOAP response parser against the old xmltodict walk.
+#
+# Usage: python bench/parse.py [--courses N] [--repeat N] [recorded_response.xml ...]
+# Without files, a synthetic response with N courses (half failing) is generated.
+# The old parser is only compared if xmltodict (no longer a dependency of the bot) is installed:
+#   pip install xmltodict
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from rich.console import Console
+from rich.table import Table
+
+from soap import parse_response
+
+
+def synthetic_response(courses):
+    # Build a response with an error for every other course and a success record for the rest.
+    errors = []
+    classes = []
+    for i in range(courses):
+        subject = f"CS {100 + i}"
+        if i % 2:
+            errors.append(f'<Error Subject="{subject}" Type="E">Class {subject} is full.&lt;br&gt;'
+                          f'You may add yourself to the wait list.&lt;br&gt;{"Details. " * 20}</Error>')
+        else:
+            classes.append(f'<Class Subject="{subject}" ClassNbr="{10000 + i}" Status="E" Units="5">'
+                           f'<Schedule Days="MWF" Start="10:30" End="11:20"/></Class>')
+    return f'<STF_SE><Errors>{"".join(errors)}</Errors><Classes>{"".join(classes)}</Classes></STF_SE>'
+
+
+def xmltodict_errors(xml):
+    # The old approach: parse the whole document into dicts and walk STF_SE/Errors/Error by hand.
+    import xmltodict
+
+    data = xmltodict.parse(xml)
+    errors = data.get("STF_SE", {}).get("Errors", [])
+    parsed = {}
+    for error in errors:
+        if isinstance(error, dict):
+            error_list = error.get("Error", [])
+            if isinstance(error_list, dict):
+                error_list = [error_list]
+            for err in error_list:
+                parsed[err.get("@Subject", "")] = err.get("#text", "").replace("<br>", "").split("\n")[0]
+    return parsed
+
+
+def measure(function, xml, repeat):
+    # Return the median time (in seconds) and the peak allocated memory (in bytes) of parsing xml.
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(xml)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function(xml)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return statistics.median(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SOAP response parsing")
+    parser.add_argument("files", nargs="*", help="recorded responses to parse")
+    parser.add_argument("--courses", type=int, default=2000, help="courses in the synthetic response")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    responses = []
+    for path in args.files:
+        with open(path, "r") as f:
+            responses.append((os.path.basename(path), f.read()))
+    if not responses:
+        responses.append((f"synthetic ({args.courses} courses)", synthetic_response(args.courses)))
+
+    parsers = [("streaming", parse_response)]
+    try:
+        import xmltodict  # noqa: F401
+        parsers.insert(0, ("xmltodict", xmltodict_errors))
+    except ImportError:
+        print("xmltodict is not installed, so only the streaming parser is measured (pip install xmltodict)")
+
+    table = Table(title=f"SOAP response parsing (median of {args.repeat})")
+    table.add_column("Response")
+    table.add_column("Size", justify="right")
+    table.add_column("Parser")
+    table.add_column("Time", justify="right")
+    table.add_column("Peak memory", justify="right")
+
+    for name, xml in responses:
+        for parser_name, function in parsers:
+            elapsed, peak = measure(function, xml, args.repeat)
+            table.add_row(name, f"{len(xml) / 1024:.0f} KiB", parser_name,
+                          f"{elapsed * 1000:.2f} ms", f"{peak / 1024:.0f} KiB")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Break bot startup into phases and compare a cold start (no cached ChromeDriver) with warm starts.
+#
+# Every run is a fresh Python process, so module imports are measured as a real start would see them.
+# Usage: python bench/startup.py [--runs N] [--no-browser]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# The phases reported, in order
+PHASES = ["interpreter", "import", "driver resolution", "browser launch", "scripts", "total"]
+
+
+def child(driver_dir, browser):
+    # Run one start in this process and print the phase timings as JSON.
+    timings = {}
+
+    start = time.perf_counter()
+    sys.path.insert(0, SRC_DIR)
+    import bot
+    timings["import"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from browser import driver_path
+    path = driver_path(driver_dir)
+    timings["driver resolution"] = time.perf_counter() - start
+
+    if browser:
+        start = time.perf_counter()
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from browser import chrome_options
+        driver = webdriver.Chrome(service=Service(path), options=chrome_options())
+        timings["browser launch"] = time.perf_counter() - start
+        driver.quit()
+
+    start = time.perf_counter()
+    bot.load_scripts()
+    timings["scripts"] = time.perf_counter() - start
+
+    print(json.dumps(timings))
+
+
+def run(driver_dir, browser):
+    # Start a child process and return its phase timings, including interpreter startup.
+    command = [sys.executable, __file__, "--child", driver_dir]
+    if not browser:
+        command.append("--no-browser")
+
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    total = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(result.stderr)
+    output = result.stdout
+
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings["total"] = total
+    timings["interpreter"] = total - sum(v for k, v in timings.items() if k not in ("total", "interpreter"))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold and warm bot startup")
+    parser.add_argument("--runs", type=int, default=5, help="number of warm starts")
+    parser.add_argument("--no-browser", action="store_true", help="skip launching Chrome")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, not args.no_browser)
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    with tempfile.TemporaryDirectory() as driver_dir:
+        # The first start has an empty ChromeDriver cache, the rest reuse it.
+        cold = run(driver_dir, not args.no_browser)
+        warm = [run(driver_dir, not args.no_browser) for _ in range(args.runs)]
+
+    table = Table(title=f"Startup phases (cold: 1 run, warm: median of {args.runs})")
+    table.add_column("Phase")
+    table.add_column("Cold", justify="right")
+    table.add_column("Warm", justify="right")
+    for phase in PHASES:
+        if phase not in cold:
+            continue
+        table.add_row(phase, f"{cold[phase] * 1000:.0f} ms",
+                      f"{statistics.median(w[phase] for w in warm) * 1000:.0f} ms")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,47 @@
 # Import the necessary modules
+# Heavy third-party modules (selenium, rich, urlmatch) are imported where they are first used,
+# so importing this module and parsing the command line stay fast and free of side effects.
+import argparse
+import atexit
 import faulthandler
 import json
 import os
+import threading
 import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
-import xmltodict
 from loguru import logger
-from rich.align import Align
-from rich.layout import Layout
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from urlmatch import urlmatch
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.utils import ChromeType
-
-# Import the Course class from course.py file
-from course import Course
-
-# Enable fault handler to catch fatal errors in Python scripts
-faulthandler.enable()
-
-# Define a constant for the wait time between each enrollment attempt (in minutes)
+
+# Import the course registry from course.py file and the bot's other modules
+from conflicts import ConflictIndex
+from course import CourseRegistry
+from display import Dashboard, Display, JsonStatus
+from http_engine import HttpEngine, SessionExpired
+from metrics import Metrics
+from page_sync import PageSync
+from plan import BATCH_ENROLL, DEFAULT_CAREER, EXECUTE_ENROLL, Target, career_request, load_plan
+from retry import RetryTracker, parse_policies
+from scheduler import AdaptiveScheduler, FixedScheduler
+from scripts import load_scripts
+from session import SessionStore
+from soap import parse_response
+from strike import estimate_offset, wait_until
+
+# Define a constant for the wait time between each enrollment attempt with the fixed scheduler (in minutes)
 WAIT_TIME = 5
 
+# Define how long before a strike to check the session and page (in seconds)
+STRIKE_WARM_LEAD = 30
+
+# Define how many cycles can reuse the loaded page before it is reloaded anyway
+RELOAD_EVERY = 10
+
+# An attempt ready to send: mode ("batch" or "plan") for the history, the (request type, payload) pairs
+# and record(results), which records the responses and returns True if any request may have succeeded
+PreparedAttempt = namedtuple("PreparedAttempt", ["mode", "requests", "record"])
+
 # Define the URL for the SimpleEnroll website
 url = "https://simpleenroll.stanford.edu/SimpleEnroll/index"
 
@@ -41,383 +54,729 @@ duo_security_domain = "https://*.duosecurity.com/frame/*"
 # Define a temporary URL for the Duo Security page (used to load cookies)
 duo_tmp_url = "https://api-531b0865.duosecurity.com/frame/v4/error?sid=frameless-1e197e52-fd22-4252-a56d-e3b15baf233a"
 
-# Load the credentials from a JSON file
-with open("credentials.json", "r") as f:
-    credentials = json.load(f)
-
-username = credentials["username"]
-password = credentials["password"]
-
-# Configure the logger to write to a file with rotation and level options
-logger.remove()
-logger.add("logs/bot.log", rotation="1 week", level="DEBUG")
 
+def load_accounts(path):
+    # Load the credentials from a JSON file holding one account, or a list of accounts.
+    with open(path, "r") as f:
+        credentials = json.load(f)
 
-class Bot:
-    def __init__(self, username, password):
-        # Initialize the bot with the given username and password
-        self.username = username
-        self.password = password
-
-        # Initialize an empty list of courses to enroll in
-        self.courses = []
+    if isinstance(credentials, dict):
+        credentials = credentials.get("accounts", [credentials])
 
-        # Initialize the Chrome options for headless mode (no GUI)
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless")
+    return credentials
 
-        # Install the ChromeDriverManager locally and create a webdriver instance with the options
-        service = Service(ChromeDriverManager(path=".chromedriver").install())
-        self.driver = webdriver.Chrome(service=service, options=options)
 
-    def get_courses(self):
-        # Get the list of enrolled and planned courses from the website using a JavaScript script
-
-        # Read the JavaScript script from a file and replace [CourseSetType] with the appropriate value
-        with open("src/js/get_course.js", "r") as f:
-            js = f.read()
-
-        # Execute the script and get the results as a list of dictionaries for each course type
-        enrolled_courses = self.driver.execute_script(
-            js.replace("[CourseSetType]", "SE_EnrolledCourseSet"))
-        planned_courses = self.driver.execute_script(
-            js.replace("[CourseSetType]", "SE_PlannedCourseSet"))
-
-        # Combine the two lists into one list of courses
-        courses = enrolled_courses + planned_courses
-
-        # For each course in the list, check if it is already in self.courses and update it if so, or add it if not.
-        for course in courses:
-            for c in self.courses:
-                if c.id == course["id"]:
-                    c.update(course)
-                    break
-            else:
-                # If the course is not in the list, add it as a Course object
-                self.courses.append(Course(course))
-
-        # We also need to remove courses that are no longer in the list by comparing their ids.
-        for c in self.courses:
-            if c.id not in [course["id"] for course in courses]:
-                self.courses.remove(c)
-
-    def batch_enroll(self):
-        # Enroll in all planned courses using a JavaScript script
-
-        # Get the updated list of courses from the website first.
-        self.get_courses()
-
-        # Print the current course table to show their status and info.
-        self.print_course_table()
-
-        # Set the status message to indicate that enrollment is in progress.
-        self.set_status("Enrolling courses...")
+def configure_logging():
+    # Enable fault handler to catch fatal errors, and configure the logger to write to a file with rotation and level options.
+    # Only done once, the first time a bot is created.
+    if getattr(configure_logging, "done", False):
+        return
+    configure_logging.done = True
 
-        # Read the JavaScript script from a file that performs batch enrollment.
-        with open("src/js/batch_enroll.js", "r") as f:
-            js = f.read()
+    faulthandler.enable()
+    logger.remove()
+    logger.add("logs/bot.log", rotation="1 week", level="DEBUG")
 
-        # Execute the script asynchronously and get the result as an XML string.
-        result = self.driver.execute_async_script(js)
 
-        # Parse the XML string into a dictionary using xmltodict module.
-        data = xmltodict.parse(result)
+def launch_browser(profile_dir, lean):
+    # Create a headless Chrome with its own driver service; selenium is only imported here.
+    from browser import new_driver
+    return new_driver(profile_dir=profile_dir, lean=lean)
 
-        # Get the list of errors from the dictionary, if any.
-        errors = data.get("STF_SE", {}).get("Errors", [])
-        parsed_errors = []
 
-        # For each error in the list, extract the subject and message fields and store them in a new list of dictionaries.
-        for error in errors:
-            if isinstance(error, dict):
-                error_list = error.get("Error", [])
-
-                for err in error_list:
-                    subject = err.get("@Subject", "")
-                    message = err.get("#text", "")
-                    parsed_errors.append(
-                        {"Subject": subject, "Message": message})
+class Bot:
+    def __init__(self, username, password, engine="browser", plan=None, scheduler=None,
+                 strike_at=None, strike_retries=0, strike_stagger=0.25, driver=None, data_dir="data",
+                 profile=False, standby=False, lean=False, policies=None, display=None, metrics=None,
+                 history=None):
+        # Set up logging the first time a bot is created.
+        configure_logging()
+
+        # Load the enroll/swap plan, if any; without one the bot batch enrolls all planned courses.
+        # This and loading the scripts can fail (e.g. on an invalid plan file), so both happen before Chrome starts.
+        self.plan = load_plan(plan) if plan else []
+
+        # Load the JavaScript scripts once so every call reuses them
+        self.scripts = load_scripts()
+
+        # Start Chrome in the background right away (unless a driver was given), so it launches while the rest of the bot is set up.
+        executor = ThreadPoolExecutor(max_workers=1)
+        browser = None
+        if driver is None:
+            browser = executor.submit(launch_browser, os.path.join(data_dir, "profile") if profile else None, lean)
 
-        # Find each course in planned_courses and update the error attribute with the corresponding message from parsed_errors.
-        for course in self.courses:
-            if not course.is_planned:
-                continue
-            subject = course.subject + " " + course.course_number
-            for error in parsed_errors:
-                if error["Subject"] == subject:
-                    course.error = error["Message"].replace(
-                        "<br>", "").split("\n")[0]
+        # Initialize the bot with the given username and password
+        self.username = username
+        self.password = password
 
-        # Refresh the driver to update the website state.
-        self.driver.refresh()
-        time.sleep(4)
+        # The engine decides how enrollment requests are sent: through the browser or directly over HTTP.
+        self.engine = engine
+        self.http = None
+
+        # Show the bot's state on the given display (a full screen dashboard by default), which renders on its own thread
+        self.display = display or Dashboard()
+        self.status = ""
+        self.attempts = 0
+
+        # Record phase timings and counters for this account (nothing is recorded unless metrics are enabled)
+        self.metrics = (metrics or Metrics()).labeled(account=username)
+
+        # Record attempts, results, course changes and cycle times in the given HistoryStore, if any
+        self.history = history
+
+        # Initialize an empty registry of courses to enroll in, keyed by psId, and watch it for changes
+        self.courses = CourseRegistry()
+        self.courses.subscribe(self.on_course_change)
+        self.changed = False
+
+        # Index the enrolled courses' meetings to catch time conflicts before sending requests, rebuilt
+        # lazily after the courses change, with the latest conflict reason for each planned course or target
+        self.conflict_index = None
+        self.conflicts = {}
+
+        # The (career, term) pairs of the planned courses, each batch enrolled with its own request, and the
+        # planned courses last found without a class number, which force the batch request for all of them
+        self.groups = []
+        self.loaded_term = None
+        self.batch_fallback = []
+
+        # Use the given scheduler to pick attempt times, or a fixed WAIT_TIME interval by default
+        self.scheduler = scheduler or FixedScheduler(WAIT_TIME * 60)
+
+        # Fire at strike_at (a datetime) with strike_retries extra attempts every strike_stagger seconds
+        self.strike_at = strike_at
+        self.strike_retries = strike_retries
+        self.strike_stagger = strike_stagger
+
+        # Set once the bot is quitting, so a strike still counting down gives up instead of holding the process
+        self.stopped = threading.Event()
+
+        # Classify errors and decide which courses to retry, using the given {category: policy} overrides
+        self.retry = RetryTracker(policies)
+
+        # Keep per-account files such as saved cookies in their own directory
+        self.data_dir = data_dir
+
+        # Save and restore all session cookies so a restart does not need to log in again
+        self.session = SessionStore(os.path.join(data_dir, "session.json"))
+
+        # Keep a logged in standby browser for instant failover, if enabled
+        self.supervisor = None
+        if standby:
+            from supervisor import Supervisor
+            self.supervisor = Supervisor(self, lambda: launch_browser(None, lean))
+
+        # Track whether the page needs reloading to see fresh course state
+        self.needs_reload = False
+        self.cycles_since_reload = 0
+
+        # Use the given webdriver instance, or wait for the headless Chrome started above
+        # (optionally with a persistent profile directory that keeps the session itself)
+        self.driver = driver or browser.result()
+        executor.shutdown(wait=False)
+
+        # Create a page synchronizer that waits for the page to be ready instead of sleeping
+        self.page = PageSync(self.driver, self.scripts["ready"])
+
+        # Report the browser's memory with the metrics. A driver handed in (by the session pool) shares its
+        # chromedriver with other accounts, so the pool reports that memory once instead.
+        if driver is None:
+            self.metrics.gauge("browser_rss_bytes", self.browser_rss)
+
+    def snapshot(self, requests=(), capture=False):
+        # Read both course sets, and optionally fire requests concurrently first, in a single WebDriver round trip.
+        with self.metrics.timer("snapshot"):
+            return self.driver.execute_async_script(
+                self.scripts["snapshot"], list(requests), capture)
+
+    def on_course_change(self, change):
+        # Remember that something changed this cycle and log what it was.
+        self.changed = True
+        if change.kind != "error":
+            self.conflict_index = None
+            if self.history is not None:
+                self.history.record_change(self.username, change)
+        if change.kind != "added":
+            logger.info(f"{change.course.name()} {change.kind}: {change.new or ''}")
 
-        # Get the updated list of courses from the website again.
-        self.get_courses()
+    def get_courses(self):
+        # Get the list of enrolled and planned courses from the website using the preloaded snapshot script.
+        with self.metrics.timer("get_courses"):
+            self.update_courses(self.snapshot())
+
+    def update_courses(self, snapshot):
+        # Update self.courses from a snapshot returned by the snapshot script, returning the changes.
+        return self.courses.update(snapshot["enrolled"] + snapshot["planned"])
+
+    def enrolled_index(self):
+        # Return the conflict index of the enrolled courses, rebuilding it if they changed.
+        if self.conflict_index is None:
+            self.conflict_index = ConflictIndex(course for course in self.courses if course.status == "E")
+        return self.conflict_index
+
+    def check_conflicts(self, planned):
+        # Record the conflict reason for each planned course and return the ones that clash with an enrolled course.
+        #
+        # Those would only be rejected by the server, so they are not sent. Planned courses that clash with
+        # each other are flagged but still sent, since only one of them can end up enrolled.
+        index = self.enrolled_index()
+        planned_index = ConflictIndex(planned)
+        blocked = set()
+        for course in planned:
+            reason = index.describe(course)
+            if reason:
+                blocked.add(course.id)
+            else:
+                reason = planned_index.describe(course)
+                reason = reason and f"{reason} (planned)"
+            if reason != self.conflicts.get(course.id):
+                logger.info(f"{course.name()} {reason or 'no longer conflicts'}")
+            self.conflicts[course.id] = reason
+        return blocked
+
+    def target_conflict(self, target):
+        # Return the reason a plan target's class conflicts with an enrolled course, or None.
+        # A swap or drop-if-enroll target may conflict with the class it gives up. Only classes in the course list
+        # have known meeting times, so any other target is never held back.
+        course = next((c for c in self.courses if str(c.class_number) == str(target.class_number)), None)
+        if course is None:
+            return None
+        return self.enrolled_index().describe(course, ignore={target.other_class_number})
+
+    def find_loaded_term(self):
+        # Return the term the page is loaded for, taken as the term most of its courses are in, or None if the
+        # page reports no terms.
+        terms = Counter(course.term for course in self.courses if course.term)
+        return terms.most_common(1)[0][0] if terms else None
+
+    def course_group(self, course):
+        # Return the (career, term) a course is enrolled through; the term is "" for the term loaded on the page,
+        # which needs no <Term> in the request.
+        term = course.term or ""
+        return course.career_code or DEFAULT_CAREER, "" if term == self.loaded_term else term
+
+    def prepare_batch(self, force=False):
+        # Decide what to send to enroll in all planned courses, with one batch request per career and term.
+        # With force (for a strike), courses are requested whether or not their retry policy allows it yet.
+        # Return the PreparedAttempt, or None if nothing is due.
+
+        # Find the careers and terms of the planned courses, e.g. undergraduate and graduate for coterms.
+        planned = [course for course in self.courses if course.is_planned]
+        self.loaded_term = self.find_loaded_term()
+        self.groups = sorted({self.course_group(course) for course in planned})
+
+        # Only request the planned courses whose retry policy allows another attempt now.
+        now = time.time()
+        blocked = self.check_conflicts(planned)
+        eligible = [course for course in planned
+                    if course.id not in blocked and (force or self.retry.eligible(course.id, now))]
+        if not eligible:
+            self.set_status("No planned courses due for a retry yet" if planned else "No planned courses")
+            return None
+
+        # Individual requests need each course's class number; without one, every planned course has to be sent.
+        missing = sorted(course.name() for course in eligible if course.class_number is None)
+        if missing and len(eligible) < len(planned) and missing != self.batch_fallback:
+            logger.warning(f"No class number for {', '.join(missing)}, so every planned course is sent in a batch "
+                           f"request, including {len(planned) - len(eligible)} held back for retries or conflicts")
+        self.batch_fallback = missing
+
+        if len(eligible) == len(planned) or missing:
+            # Send a batch enrollment request for every career and term at once.
+            requests = [(BATCH_ENROLL, career_request(career, term)) for career, term in self.groups]
+            requested = [[course for course in planned if self.course_group(course) == group] for group in self.groups]
+        else:
+            # Send one enrollment request per eligible course instead, all at once, with the grading basis and
+            # units the page shows for it (left empty for Simple Enroll's defaults if it shows none).
+            requests = []
+            requested = [[course] for course in eligible]
+            for course in eligible:
+                career, term = self.course_group(course)
+                target = Target({"career": career, "term": term, "class_number": course.class_number,
+                                 "grading_basis": course.grading_basis or "", "units": course.units or ""})
+                requests.append((EXECUTE_ENROLL, target.to_request()))
 
-    def swap_french(self):
-        # Enroll in all planned courses using a JavaScript script
+        # Set the status message to indicate that enrollment is in progress.
+        if len(self.groups) > 1:
+            self.set_status(f"Enrolling courses in {', '.join(' '.join(filter(None, g)) for g in self.groups)}...")
+        else:
+            self.set_status("Enrolling courses...")
+        return PreparedAttempt("batch", requests, lambda results: self.batch_results(requested, results))
+
+    def batch_results(self, requested, results):
+        # Update the course errors from the results of a batch attempt, where requested lists the courses each
+        # request was for, and return True if any requested course got no error, so it may have been enrolled.
+        enrolled = False
+        for courses, result in zip(requested, results):
+            with self.metrics.timer("parse"):
+                response = parse_response(result)
+            self.apply_errors(response)
+
+            for course in courses:
+                # A request for one course is answered for that course alone, whatever subject the error has.
+                # An error without a subject (e.g. for the whole request) applies to every course it was for.
+                error = response.errors.get(course.name())
+                if error is None:
+                    error = response.first_error() if len(courses) == 1 else response.errors.get("")
+
+                # Classify the course's error to decide when to retry it.
+                category = None
+                if error is not None:
+                    self.courses.set_error(course, error)
+                    category = self.retry.failure(course.id, error)
+                    self.metrics.count("errors_total", category=category)
+                else:
+                    self.retry.success(course.id)
+                    enrolled = True
+                if self.history is not None:
+                    self.history.record_result(self.username, course.name(), category, error)
+
+        return enrolled
+
+    def prepare_attempt(self, force=False):
+        # Decide what the next attempt sends: the plan if there is one, or batch enrollment otherwise.
+        # With force, every course or target is sent regardless of its retry policy.
+        if self.plan:
+            return self.prepare_plan(force)
+        return self.prepare_batch(force)
+
+    def send_attempt(self, prepared, read_courses=True):
+        # Send a prepared attempt and record its results.
+        # Return True if any request may have succeeded, so the course state needs to be reloaded.
+        start = time.perf_counter()
+        results = self.execute_requests(prepared.requests, read_courses)
+        if self.history is not None:
+            self.history.record_attempt(self.username, prepared.mode, len(results), time.perf_counter() - start)
+        return prepared.record(results)
+
+    def attempt(self, force=False):
+        # Try to enroll using the plan if there is one, or batch enrollment otherwise.
+        # Return True if any request may have succeeded, so the course state needs to be reloaded.
+        prepared = self.prepare_attempt(force)
+        if prepared is None:
+            # Still read the course sets the page holds, so the course table is current. They only include courses
+            # planned or changed elsewhere once cycle() reloads the page (at least every RELOAD_EVERY cycles).
+            self.get_courses()
+            return False
+        return self.send_attempt(prepared)
+
+    def strike(self):
+        # Fire enrollment at the strike time as measured by the server's clock.
+        target = self.strike_at.timestamp()
+
+        # Estimate the server clock offset from response Date headers.
+        self.set_status("Estimating server clock offset...")
+        offset, uncertainty = estimate_offset(url)
+        logger.info(f"Server clock offset {offset * 1000:+.0f} ms (±{uncertainty * 1000:.0f} ms)")
+
+        # Count down to shortly before the strike time, then make sure the session and page are warm.
+        self.set_countdown("Strike in {seconds} seconds...", target - offset)
+        while (remaining := target - (time.time() + offset)) > STRIKE_WARM_LEAD:
+            if self.stopped.wait(remaining - STRIKE_WARM_LEAD):
+                return []
+
+        self.set_status("Warming up for strike...")
+        if not self.is_logged_in():
+            self.relogin()
+        self.page.wait()
+
+        # Fire at the target instant, then at each staggered retry. Every fire sends all courses (or targets), even
+        # after an earlier fire in the strike classified them for backoff or suppression.
+        errors = []
+        for i in range(self.strike_retries + 1):
+            if self.stopped.is_set():
+                break
+
+            # Build the requests before waiting, so nothing but sending them is left once the time comes, and
+            # measure how far from the target they were dispatched.
+            prepared = self.prepare_attempt(force=True)
+            if prepared is None:
+                logger.warning(f"Strike {i + 1}: nothing to send")
+                break
+            fire_at = target + i * self.strike_stagger
+            wait_until(fire_at, offset)
+            errors.append(time.time() + offset - fire_at)
+            start = time.perf_counter()
+            self.send_attempt(prepared, read_courses=False)
+            logger.info(f"Strike {i + 1} fired {errors[-1] * 1000:+.1f} ms from target, "
+                        f"round trip {(time.perf_counter() - start) * 1000:.0f} ms")
+
+            # The HTTP engine only sent the requests, so read the courses before preparing the next fire.
+            if self.http is not None:
+                self.get_courses()
 
-        # Get the updated list of courses from the website first.
-        self.get_courses()
+        if not errors:
+            self.set_status("Strike had nothing to send")
+            return errors
+
+        # Report how close to the target each fire was.
+        worst = max(errors, key=abs) * 1000
+        self.set_status(f"Strike fired {len(errors)} time(s), first {errors[0] * 1000:+.1f} ms, "
+                        f"worst {worst:+.1f} ms from target (clock ±{uncertainty * 1000:.0f} ms)")
+
+        return errors
+
+    def prepare_plan(self, force=False):
+        # Decide what to send to enroll in, swap or drop-if-enroll every target in the plan at once.
+        # With force (for a strike), targets are fired whether or not their retry policy allows it yet.
+        # Return the PreparedAttempt, or None if nothing is due.
+
+        # Only fire the targets whose retry policy allows another attempt now.
+        now = time.time()
+        targets = []
+        for target in self.plan:
+            # Skip targets that would only be rejected for a time conflict with an enrolled course.
+            reason = self.target_conflict(target)
+            if reason != self.conflicts.get(target.name()):
+                logger.info(f"Target {target}: {reason or 'no longer conflicts'}")
+            self.conflicts[target.name()] = reason
+            if reason:
+                target.error = reason
+            elif force or self.retry.eligible(target.name(), now):
+                targets.append(target)
+        if not targets:
+            self.set_status("No plan targets due for a retry yet")
+            return None
+
+        # Set the status message to indicate that enrollment is in progress, and fire one request per target.
+        self.set_status(f"Running plan ({len(targets)} of {len(self.plan)} targets)...")
+        return PreparedAttempt("plan", [(EXECUTE_ENROLL, target.to_request()) for target in targets],
+                               lambda results: self.plan_results(targets, results))
+
+    def plan_results(self, targets, results):
+        # Record the result of each target, classify its error and update the course errors from all of them.
+        # Return True if any target got no error, so it may have been enrolled.
+        for target, result in zip(targets, results):
+            with self.metrics.timer("parse"):
+                response = parse_response(result)
+            target.error = response.first_error()
+            category = None
+            if target.error:
+                category = self.retry.failure(target.name(), target.error)
+                self.metrics.count("errors_total", category=category)
+                logger.info(f"Target {target}: {category}: {target.error}")
+            else:
+                self.retry.success(target.name())
+                logger.info(f"Target {target}: OK")
+            if self.history is not None:
+                self.history.record_result(self.username, target.name(), category, target.error)
+            self.apply_errors(response)
 
-        # Print the current course table to show their status and info.
-        self.print_course_table()
+        return any(target.error is None for target in targets)
 
-        # Set the status message to indicate that enrollment is in progress.
-        self.set_status("Enrolling courses...")
-
-        # Read the JavaScript script from a file that performs batch enrollment.
-        with open("src/js/swap_french.js", "r") as f:
-            js = f.read()
-
-        # Execute the script asynchronously and get the result as an XML string.
-        result = self.driver.execute_async_script(js)
-
-        # Parse the XML string into a dictionary using xmltodict module.
-        data = xmltodict.parse(result)
-
-        # Get the list of errors from the dictionary, if any.
-        errors = data.get("STF_SE", {}).get("Errors", [])
-        parsed_errors = []
-        
-        # For each error in the list, extract the subject and message fields and store them in a new list of dictionaries.
-        for error in errors:
-            if isinstance(error, dict):
-                error_list = error.get("Error", [])
-
-                for err in error_list:
-                    subject = err.get("@Subject", "")
-                    message = err.get("#text", "")
-                    parsed_errors.append(
-                        {"Subject": subject, "Message": message})
-
-        # Find each course in planned_courses and update the error attribute with the corresponding message from parsed_errors.
+    def apply_errors(self, response):
+        # Find each planned course in the response's errors (keyed by subject and course number) and update its error.
         for course in self.courses:
             if not course.is_planned:
                 continue
-            subject = course.subject + " " + course.course_number
-            for error in parsed_errors:
-                if error["Subject"] == subject:
-                    course.error = error["Message"].replace(
-                        "<br>", "").split("\n")[0]
-
-        # Refresh the driver to update the website state.
-        self.driver.refresh()
-        time.sleep(4)
-
-        # Get the updated list of courses from the website again.
-        self.get_courses()
-    
-
-    def set_status(self, status, log=True):
-        # Set the status message to be displayed on the live console and optionally log it to a file.
-
-        if log:
-            logger.info(status)
-
-        # Format the status message with green color and add it to a panel.
-        status_message = f"[green]Status:[/] {status}"
-        status_panel = Panel(
-            status_message, border_style="green", expand=True, padding=(0, 1))
-
-        # Update the status layout with the new panel.
-        self.layout["status"].update(status_panel)
-
-    def add_attempt(self, attempts):
-        # Increment the number of attempts and update the attempts layout with a new panel.
-
-        attempts += 1
-        self.layout["attempts"].update(
-            Panel(f"[green]Attempts:[/] {attempts}", border_style="green", expand=True, padding=(0, 1)))
-
-        return attempts
+            error = response.errors.get(course.name())
+            if error is not None:
+                self.courses.set_error(course, error)
+
+    def execute_requests(self, requests, read_courses=True):
+        # Send SE_NetworkEndpoint requests concurrently and return their SOAP responses as XML strings, in order.
+        # The browser reads the courses in the same round trip; the HTTP engine reads them first unless
+        # read_courses is False (for a strike, where the requests must go out first).
+
+        # With the HTTP engine ready, read the courses and post the requests directly using the browser's session cookies.
+        if self.http is not None:
+            if read_courses:
+                self.get_courses()
+            try:
+                with self.metrics.timer("http"):
+                    return self.http.execute_all(requests)
+            except SessionExpired:
+                # The session expired, so log in again with the browser and reload the cookies.
+                logger.info("HTTP session expired, logging in again")
+                self.relogin()
+                self.http.load_cookies(self.driver.get_cookies())
+                with self.metrics.timer("http"):
+                    return self.http.execute_all(requests)
+
+        # Otherwise send the requests through the browser, capturing the first one if the HTTP engine is enabled.
+        capture = self.engine == "http"
+        snapshot = self.snapshot(
+            [{"type": t, "payload": p} for t, p in requests], capture)
+        self.update_courses(snapshot)
+        results = snapshot["results"]
+
+        if capture:
+            request_type, payload = requests[0]
+            try:
+                self.http = HttpEngine.from_capture(
+                    results[0]["request"], request_type, payload, self.driver.get_cookies())
+                logger.info("HTTP engine ready for " + self.http.template.url)
+            except (KeyError, TypeError, ValueError) as e:
+                # If the request could not be captured, keep using the browser.
+                logger.warning("Could not capture request for HTTP engine: " + str(e))
+                self.engine = "browser"
+
+        return [result["response"] for result in results]
+
+    def set_status(self, status):
+        # Set the status message to be displayed and log it to a file.
+        logger.info(status)
+
+        # Keep the plain status so other views (like the session pool) can show it.
+        self.status = status
+        self.display.post("status", text=status)
+
+    def set_countdown(self, text, until):
+        # Show a status that counts down to the until timestamp, where text contains "{seconds}".
+        # The display ticks the countdown itself, so the bot can just sleep.
+        self.status = text.format(seconds=max(0, int(until - time.time())))
+        self.display.post("countdown", text=text, until=until)
+
+    def add_attempt(self):
+        # Increment the number of attempts and show it.
+        self.attempts += 1
+        self.metrics.count("attempts_total")
+        self.display.post("attempts", count=self.attempts)
+
+    def course_row(self, course):
+        # Return the course's name, time, status and info as shown in the course table.
+        status = "✅ Enrolled" if course.status == "E" else "Not Enrolled"
+        retry = self.retry.describe(course.id) if course.is_planned else ""
+        if retry:
+            status += f" ({retry})"
+
+        # Show a local time conflict alongside any error from the server.
+        info = course.error or ""
+        conflict = self.conflicts.get(course.id) if course.is_planned else None
+        if conflict:
+            info = f"[yellow]⚠ {conflict[0].upper()}{conflict[1:]}[/]" + (f"\n{info}" if info else "")
+
+        # Tell courses apart by career and term when there is more than one.
+        name = course.name()
+        if len(self.groups) > 1:
+            name += f" ({' '.join(filter(None, self.course_group(course)))})"
+
+        return (name, course.get_time(), status, info)
 
     def print_course_table(self):
-        # Print a table of courses with their names, times, statuses and info on the live console.
-
-        # Create a table object with headers and styles using rich module.
-        table = Table(show_header=True, header_style="bold green",
-                      padding=(0, 1), show_lines=True, expand=True)
-        table.add_column("Course", justify="left", max_width=20)
-        table.add_column("Time", justify="left")
-        table.add_column("Status", justify="left")
-        table.add_column("Info", justify="left", max_width=80)
-
-        # Clear the table rows before adding updated data
-        table.rows = []
-
-        # For each course in self.courses (sorted by name), add a row with its name, time, status and info.
-        for course in sorted(self.courses, key=lambda x: x.name()):
-            status = "✅ Enrolled" if course.status == "E" else "Not Enrolled"
-            table.add_row(course.name(), course.get_time(),
-                          status, course.error)
-
-        # Add the table to a panel and update the table layout with it.
-        table_panel = Panel(table, border_style="green",
-                            expand=True, padding=(0, 1))
-        self.layout["table"].update(table_panel)
+        # Send the course table rows to the display, which redraws only the rows that changed.
+        self.display.post("rows", rows={course.id: self.course_row(course) for course in self.courses})
 
     def quit_program(self):
-        # Quit the program gracefully by closing the driver and stopping the live console.
+        # Quit the program gracefully by closing the driver and stopping the display.
 
+        self.stopped.set()
         self.set_status("[bold red]Quitting...[/bold red]")
+        if self.supervisor is not None:
+            self.supervisor.stop()
+        if self.http is not None:
+            self.http.close()
         self.driver.quit()
-        time.sleep(1)
-        self.live.stop()
+        self.display.stop()
         exit(1)
 
-    def run(self):
-        # Run the main loop of the bot.
-
-        # Create a layout object with sub-layouts for title, status, attempts and table using rich module.
-        layout = Layout(name="")
-        status_layout = Layout(name="status_panel", size=3)
-        status_layout.split_row(Layout(name="status"),
-                                Layout(name="attempts"))
-        layout.split(Layout(name="Title", size=3),
-                     status_layout, Layout(name="table"))
-
-        # Add a panel with a title to the title layout.
-        layout["Title"].update(
-            Panel(Align("[bold green]SimpleEnroll Bot[/bold green]", "center"), expand=True, border_style="green"))
-
-        # Add a panel with the initial number of attempts to the attempts layout.
-        layout["attempts"].update(
-            Panel(f"[green]Attempts:[/] 0", border_style="green", expand=True, padding=(0, 1)))
-
-        # Initialize the number of attempts to zero.
-        attempts = 0
-
-        # Create a live object with the layout and refresh rate using rich module.
-        with Live(layout, refresh_per_second=6, screen=True) as live:
-            try:
-                # Store the live object and the layout object as attributes of the bot for easy access.
-                self.live = live
-                self.layout = layout
-
-                # Set the initial status message to indicate that the bot is initializing.
-                self.set_status("Initializing...")
-
-                # Print an empty course table to show the layout.
-                self.print_course_table()
-
-                # Check if there is a file with Duo Security cookies and load them if so, or login normally if not.
-                if os.path.exists("data/duo_cookies.json"):
-                    self.load_duo_cookies()
-                    self.login(needs_duo=False)
-                else:
-                    self.login(needs_duo=True)
-
-                # Wait for 3 seconds to let the website load completely.
-                time.sleep(3)
-
-                # Get the list of courses from the website and print them on the table.
-                self.get_courses()
-                self.print_course_table()
-
-                # Start an infinite loop that tries to enroll in planned courses every WAIT_TIME minutes.
-                while True:
+    def start(self, strike=True):
+        # Log in and load the initial course list, then fire the strike if one is set (unless strike is False,
+        # for callers that fire it themselves with fire_strike()).
+
+        # Set the initial status message to indicate that the bot is initializing.
+        self.set_status("Initializing...")
+
+        # Restore the saved session if there is one, falling back to the Duo Security cookies or a normal login.
+        with self.metrics.timer("login"):
+            if self.session.load(self.driver):
+                self.set_status("Restored saved session")
+                self.login(needs_duo=False)
+            elif os.path.exists(os.path.join(self.data_dir, "duo_cookies.json")):
+                self.load_duo_cookies()
+                self.login(needs_duo=False)
+            else:
+                self.login(needs_duo=True)
 
-                    # Check if the bot is still logged in by visiting the SimpleEnroll URL and comparing it with the current URL.
-                    if not self.is_logged_in():
-                        # If not logged in, login again.
-                        self.login()
+        # Wait for the website to load its course sets.
+        with self.metrics.timer("page_wait"):
+            self.page.wait()
 
-                    # Wait for 2 seconds to let the website load completely.
-                    time.sleep(2)
+        # Get the list of courses from the website and print them on the table.
+        self.get_courses()
+        self.print_course_table()
 
-                    # Try to enroll in planned courses using batch enrollment and print the updated course table.
-                    # self.batch_enroll()
-                    self.swap_french()
-                    self.print_course_table()
+        # If a strike time is set, fire at that instant before falling back to the regular loop.
+        if strike and self.strike_at is not None:
+            self.fire_strike()
 
-                    # Increment the number of attempts and update the attempts layout with it.
-                    attempts = self.add_attempt(attempts)
+    def fire_strike(self):
+        # Fire the strike and show its results.
+        self.strike()
+        self.print_course_table()
+        self.add_attempt()
+
+    def cycle(self):
+        # Run one enrollment attempt and schedule the next one.
+        start = time.perf_counter()
+
+        # Check if the bot is still logged in with a cheap in-page probe, and login again if not.
+        with self.metrics.timer("is_logged_in"):
+            logged_in = self.is_logged_in()
+        if not logged_in:
+            # Switch to the standby browser if there is one ready, otherwise log in again.
+            if self.supervisor is None or not self.supervisor.failover("logged out"):
+                self.relogin()
+                with self.metrics.timer("page_wait"):
+                    self.page.wait()
+            self.cycles_since_reload = 0
+
+        # Reload the page only when the course state may have changed, or every RELOAD_EVERY cycles to pick up outside changes.
+        elif self.needs_reload or self.cycles_since_reload >= RELOAD_EVERY:
+            with self.metrics.timer("reload"):
+                self.page.reload()
+            self.cycles_since_reload = 0
+
+        self.cycles_since_reload += 1
+
+        # Track whether the course registry reports any change this cycle.
+        self.changed = False
+
+        # Try to enroll and print the updated course table.
+        self.needs_reload = self.attempt()
+        self.print_course_table()
 
-                    # Set the status message to indicate that the bot is waiting for the next attempt.
-                    self.set_status("Waiting...")
+        # Increment the number of attempts and update the attempts layout with it.
+        self.add_attempt()
 
-                    # Wait for WAIT_TIME minutes and update the status message every 5 seconds to show how much time is left.
-                    for i in range(0, int(WAIT_TIME * 60), 5):
-                        self.set_status(
-                            f"Waiting... {int(WAIT_TIME * 60) - i} seconds left")
-                        time.sleep(5)
+        # Let the scheduler pick the next attempt time based on whether anything changed.
+        self.scheduler.record(self.changed)
+        self.metrics.observe("cycle", time.perf_counter() - start)
+        if self.history is not None:
+            self.history.record_cycle(self.username, time.perf_counter() - start, self.changed)
 
-            except KeyboardInterrupt:
-                # If the user presses Ctrl+C, quit the program gracefully.
-                self.quit_program()
-            except Exception as e:
-                # If any other exception occurs, log it to a file and quit the program gracefully.
-                logger.exception(e)
-                self.quit_program()
+    def wait(self):
+        # Wait until the next attempt, with the display counting down how much time is left.
+        next_fire = time.strftime("%H:%M:%S", time.localtime(self.scheduler.next_fire))
+        self.set_countdown(f"Waiting... {{seconds}} seconds left (next attempt at {next_fire}, {self.scheduler.describe()})",
+                           self.scheduler.next_fire)
+        while (remaining := self.scheduler.next_fire - time.time()) > 0:
+            time.sleep(remaining)
 
-    def login(self, needs_duo=False):
-        # Login to the SimpleEnroll website using username and password.
+    def run(self):
+        # Run the main loop of the bot.
+        from selenium.common.exceptions import WebDriverException
+
+        # Start the display, which renders on its own thread from the events the bot posts.
+        self.display.start()
+
+        try:
+            # Log in and load the courses.
+            self.start()
+
+            # Start building the standby browser now that the session is saved.
+            if self.supervisor is not None:
+                self.supervisor.start()
+
+            # Start an infinite loop that tries to enroll in planned courses whenever the scheduler says so.
+            while True:
+                try:
+                    self.cycle()
+                except WebDriverException as e:
+                    # If the browser crashed or hung, switch to the standby browser and retry right away.
+                    if self.supervisor is None or not self.supervisor.failover(type(e).__name__):
+                        raise
+                    continue
+                self.wait()
+
+        except KeyboardInterrupt:
+            # If the user presses Ctrl+C, quit the program gracefully.
+            self.quit_program()
+        except Exception as e:
+            # If any other exception occurs, log it to a file and quit the program gracefully.
+            logger.exception(e)
+            self.quit_program()
+
+    def login(self, needs_duo=False, driver=None):
+        # Login to the SimpleEnroll website using username and password, in the bot's browser or the given one.
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        from urlmatch import urlmatch
+
+        driver = driver or self.driver
+
+        # Only show status messages for the bot's own browser; others (like the standby) just log them.
+        status = self.set_status if driver is self.driver else lambda message: logger.info("Standby: " + message)
 
         # Set the status message to indicate that login is in progress.
-        self.set_status("Logging in...")
+        status("Logging in...")
 
         # Visit the SimpleEnroll URL using the driver.
-        self.driver.get(url)
+        driver.get(url)
 
         # If the current URL is already equal to SimpleEnroll URL, then return as login is not needed.
-        if self.driver.current_url == url:
+        if driver.current_url == url:
+            self.session.save(driver)
             return
 
         # Wait for the URL to change after entering username and password and clicking on proceed button.
-        current = self.driver.current_url
-        self.driver.find_element("name", "username").send_keys(self.username)
-        self.driver.find_element("name", "password").send_keys(self.password)
-        self.driver.find_element("name", "_eventId_proceed").click()
+        current = driver.current_url
+        driver.find_element("name", "username").send_keys(self.username)
+        driver.find_element("name", "password").send_keys(self.password)
+        driver.find_element("name", "_eventId_proceed").click()
 
-        WebDriverWait(self.driver, 20).until(
+        WebDriverWait(driver, 20).until(
             lambda d: d.current_url != current)
 
         if needs_duo:
             # If Duo Security page is needed, check if the current URL matches its domain using urlmatch module.
-            logger.info(self.driver.current_url + " " + duo_security_domain)
-            if urlmatch(duo_security_domain, self.driver.current_url):
-                current = self.driver.current_url
+            logger.info(driver.current_url + " " + duo_security_domain)
+            if urlmatch(duo_security_domain, driver.current_url):
+                current = driver.current_url
                 logger.info("Duo security page loaded!")
 
                 # Set the status message to indicate that 2FA is needed and wait for it.
-                self.set_status("Waiting for 2fA.")
+                status("Waiting for 2fA.")
 
                 # Wait for button with text "Yes, trust browser" to be clickable and click on it.
-                WebDriverWait(self.driver, 40).until(
+                WebDriverWait(driver, 40).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Yes, trust browser')]"))).click()
 
                 # Wait for 2FA to complete and the URL to change.
-                WebDriverWait(self.driver, 20).until(
+                WebDriverWait(driver, 20).until(
                     lambda d: d.current_url != current)
 
                 # Set the status message to indicate that Duo Security cookies are being saved.
-                self.set_status("Saving Duo Security cookies...")
+                status("Saving Duo Security cookies...")
 
                 # Go back to Duo Security page, it will be invalid, but it doesn't matter.
-                self.driver.get(current)
+                driver.get(current)
 
                 # Get the cookies from the driver and save them to a JSON file for future use.
-                cookies = self.driver.get_cookies()
+                cookies = driver.get_cookies()
 
-                if not os.path.exists("data"):
-                    os.makedirs("data")
-                f = open("data/duo_cookies.json", "w+")
+                if not os.path.exists(self.data_dir):
+                    os.makedirs(self.data_dir)
+                f = open(os.path.join(self.data_dir, "duo_cookies.json"), "w+")
                 json.dump(cookies, f)
                 f.close()
 
                 # Set the status message to indicate that Duo Security cookies are saved.
-                self.set_status("Saved Duo Security cookies!")
+                status("Saved Duo Security cookies!")
 
                 # Go back to SimpleEnroll URL using the driver.
-                self.driver.get(url)
+                driver.get(url)
 
         # Wait for the current URL to be equal to SimpleEnroll URL using WebDriverWait.
-        WebDriverWait(self.driver, 20).until(lambda d: d.current_url == url)
+        WebDriverWait(driver, 20).until(lambda d: d.current_url == url)
+
+        # Save the whole session so a restart can skip the login.
+        self.session.save(driver)
 
         # Set the status message to indicate that login is successful.
-        self.set_status("Logged in!")
+        status("Logged in!")
+
+    def relogin(self):
+        # Log in again after the session was lost.
+        self.metrics.count("relogins_total")
+        with self.metrics.timer("login"):
+            self.login()
+
+    def browser_rss(self):
+        # Return the resident memory of the browser, for the metrics.
+        from browser import driver_rss
+        return driver_rss(self.driver)
 
     def load_duo_cookies(self):
         # Load the Duo Security cookies from a JSON file and add them to the driver.
@@ -429,7 +788,7 @@ class Bot:
         self.driver.get(duo_tmp_url)
 
         # Load the cookies from the JSON file using json module.
-        cookies_path = "data/duo_cookies.json"
+        cookies_path = os.path.join(self.data_dir, "duo_cookies.json")
         with open(cookies_path, "r") as f:
             cookies = json.load(f)
 
@@ -440,17 +799,125 @@ class Bot:
 
             self.driver.add_cookie(cookie)
 
-    def is_logged_in(self):
-        # Check if the bot is still logged in by visiting the SimpleEnroll URL and comparing it with the current URL.
+    def is_logged_in(self, driver=None):
+        # Check if the bot (or the given browser) is still logged in.
+        driver = driver or self.driver
 
-        # Visit the SimpleEnroll URL using the driver.
-        self.driver.get(url)
+        # If the browser is on the SimpleEnroll page, probe the session in place without navigating.
+        if driver.current_url == url:
+            return bool(driver.execute_async_script(self.scripts["probe"]))
+
+        # Otherwise visit the SimpleEnroll URL and compare it with the current URL.
+        driver.get(url)
+        return driver.current_url == url
+
+    def attach(self, driver):
+        # Switch the bot to another, already logged in browser.
+        self.driver = driver
+        self.page = PageSync(driver, self.scripts["ready"])
+        self.needs_reload = False
+        self.cycles_since_reload = 0
 
-        # Return True if the current URL is equal to SimpleEnroll URL, False otherwise.
-        return self.driver.current_url == url
+        # Hand the new browser's cookies to the HTTP engine.
+        if self.http is not None:
+            self.http.load_cookies(driver.get_cookies())
 
 
 if __name__ == "__main__":
-    # Create a bot instance with username and password and run it.
-    bot = Bot(username, password)
-    bot.run()
+    # Parse the command line options.
+    parser = argparse.ArgumentParser(description="Simple Enroll Bot")
+    parser.add_argument("--engine", choices=["browser", "http"], default="browser",
+                        help="send enrollment requests through the browser or directly over HTTP")
+    parser.add_argument("--plan", help="JSON file listing enroll/swap/drop-if-enroll targets per career")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="poll faster around likely seat openings and back off when nothing changes")
+    parser.add_argument("--burst-at", action="append", default=[], type=datetime.fromisoformat,
+                        help="time (ISO format) around which to poll at the fastest rate; can be repeated")
+    parser.add_argument("--max-per-minute", type=int, default=2,
+                        help="maximum number of attempts per minute with --adaptive")
+    parser.add_argument("--strike-at", type=datetime.fromisoformat,
+                        help="time (ISO format, server clock) at which to fire enrollment exactly")
+    parser.add_argument("--strike-retries", type=int, default=0,
+                        help="number of extra attempts to fire after the strike")
+    parser.add_argument("--strike-stagger", type=float, default=0.25,
+                        help="seconds between strike retries")
+    parser.add_argument("--profile", action="store_true",
+                        help="keep a persistent Chrome profile in the data directory")
+    parser.add_argument("--standby", action="store_true",
+                        help="keep a second logged in browser ready to take over if the first one fails")
+    parser.add_argument("--policy", action="append", default=[],
+                        help="retry policy for an error category, e.g. full=hammer or conflict=suppress; can be repeated")
+    parser.add_argument("--lean", action="store_true",
+                        help="block images, fonts, stylesheets and analytics and turn off unneeded Chrome features")
+    parser.add_argument("--pool", action="store_true",
+                        help="run every account in credentials.json in one process")
+    parser.add_argument("--headless", action="store_true",
+                        help="write JSON status lines to stdout instead of showing the live dashboard")
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-dump",
+                        help="write the metrics to this file when the bot exits")
+    parser.add_argument("--history", default=os.path.join("data", "history.db"),
+                        help="SQLite file recording every attempt, result and course change (see src/history.py)")
+    parser.add_argument("--no-history", action="store_true", help="don't record any history")
+    parser.add_argument("--concurrency", type=int, default=2,
+                        help="maximum number of accounts running a cycle at the same time with --pool")
+    args = parser.parse_args()
+
+    # Check the retry policy overrides.
+    try:
+        policies = parse_policies(args.policy)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Load the credentials from a JSON file
+    accounts = load_accounts("credentials.json")
+
+    # Collect metrics only if they are served or dumped, shared by every account.
+    metrics = Metrics(enabled=args.metrics_port is not None or args.metrics_dump is not None)
+    if args.metrics_port is not None:
+        try:
+            metrics.serve(args.metrics_port)
+        except OSError as e:
+            parser.error(f"Could not serve metrics on port {args.metrics_port}: {e}")
+    if args.metrics_dump:
+        atexit.register(metrics.dump, args.metrics_dump)
+
+    # Record the history of every account in one database, written in the background.
+    history = None
+    if not args.no_history:
+        from history import HistoryStore
+        history = HistoryStore(args.history)
+        atexit.register(history.close)
+
+    def make_scheduler():
+        # Pick the scheduler.
+        if args.adaptive:
+            return AdaptiveScheduler(
+                burst_times=args.burst_at, max_per_minute=args.max_per_minute)
+        return None
+
+    def make_display(account):
+        # Write JSON status lines when headless; otherwise the dashboard shows a single bot and the pool shows its own table.
+        if args.headless:
+            return JsonStatus(account["username"] if args.pool else None)
+        return Display() if args.pool else Dashboard()
+
+    def make_bot(account, driver=None, data_dir="data"):
+        # Create a bot instance for one account, with its own plan if the account lists one.
+        return Bot(account["username"], account["password"], engine=args.engine,
+                   plan=account.get("plan", args.plan), scheduler=make_scheduler(),
+                   strike_at=args.strike_at, strike_retries=args.strike_retries,
+                   strike_stagger=args.strike_stagger, driver=driver, data_dir=data_dir,
+                   profile=args.profile, standby=args.standby and not args.pool, lean=args.lean,
+                   policies=policies, display=make_display(account), metrics=metrics, history=history)
+
+    if args.pool:
+        # Run every account concurrently in one process.
+        from pool import SessionPool
+        SessionPool(accounts, make_bot, concurrency=args.concurrency, profile=args.profile,
+                    lean=args.lean, headless=args.headless, metrics=metrics).run()
+    else:
+        # Create a bot instance with username and password and run it.
+        bot = make_bot(accounts[0])
+        bot.run()
@@ -0,0 +1,189 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+# Define where ChromeDriver is downloaded and where its resolved path is cached
+DRIVER_DIR = ".chromedriver"
+DRIVER_CACHE = "resolved.json"
+
+# Commands that print the installed Chrome version, tried in order
+CHROME_VERSION_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+]
+
+# Define how long a page load or script may take before it counts as hung (in seconds)
+COMMAND_TIMEOUT = 30
+
+# Chrome features the bot never needs, turned off in lean mode
+LEAN_ARGUMENTS = [
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+    "--renderer-process-limit=2",
+    "--js-flags=--max-old-space-size=256",
+]
+
+# URL patterns blocked in lean mode: images, fonts and media everywhere, Simple Enroll's own stylesheets
+# (login and Duo pages keep theirs so their buttons stay clickable), and third-party analytics
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*simpleenroll.stanford.edu*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*siteimproveanalytics.com*", "*siteimprove.com*", "*hotjar.com*", "*newrelic.com*", "*nr-data.net*",
+]
+
+
+class SharedService(Service):
+    def __init__(self, *args, **kwargs):
+        # A ChromeDriver service that is started once and shared by several webdriver.Chrome instances.
+        super().__init__(*args, **kwargs)
+        self.users = 0
+        self.lock = threading.Lock()
+
+    def start(self):
+        # Only launch the chromedriver process for the first driver.
+        with self.lock:
+            if self.users == 0:
+                super().start()
+            self.users += 1
+
+    def stop(self):
+        # Only stop the chromedriver process once the last driver has quit.
+        with self.lock:
+            self.users -= 1
+            if self.users == 0:
+                super().stop()
+
+
+def chrome_options(profile_dir=None, lean=False):
+    # Initialize the Chrome options for headless mode (no GUI)
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless")
+
+    # Turn off everything the bot does not need in lean mode
+    if lean:
+        for argument in LEAN_ARGUMENTS:
+            options.add_argument(argument)
+
+    # Keep cookies and storage in a persistent profile directory, if given
+    if profile_dir:
+        options.add_argument("--user-data-dir=" + os.path.abspath(profile_dir))
+
+    return options
+
+
+def chrome_version():
+    # Return the installed Chrome version, or None if it can't be found.
+    for command in CHROME_VERSION_COMMANDS:
+        if command[0] == "reg" and sys.platform != "win32":
+            continue
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"\d+\.\d+\.\d+\.\d+", output)
+        if match:
+            return match.group(0)
+    return None
+
+
+def driver_path(driver_dir=DRIVER_DIR):
+    # Return the chromedriver path, reusing the cached one while the installed Chrome version is unchanged.
+    cache_path = os.path.join(driver_dir, DRIVER_CACHE)
+    version = chrome_version()
+
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+        if version is not None and cache["chrome_version"] == version and os.path.exists(cache["driver_path"]):
+            return cache["driver_path"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Chrome changed or nothing is cached, so let webdriver_manager look up and install the matching driver.
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager(path=driver_dir).install()
+
+    if version is not None:
+        os.makedirs(driver_dir, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"chrome_version": version, "driver_path": path}, f)
+
+    return path
+
+
+def new_driver(service=None, profile_dir=None, lean=False):
+    # Create a webdriver instance, using the given (possibly shared) service or a new one.
+    service = service or Service(driver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options(profile_dir, lean))
+
+    # Block non-essential requests through the DevTools protocol in lean mode.
+    if lean:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+    # Fail hung page loads and scripts with a TimeoutException instead of blocking forever.
+    driver.set_page_load_timeout(COMMAND_TIMEOUT)
+    driver.set_script_timeout(COMMAND_TIMEOUT)
+    return driver
+
+
+def process_tree_rss(pid):
+    # Return the resident memory (in bytes) of a process and all its descendants, e.g. chromedriver and its Chromes.
+    # Reads /proc, so this only works on Linux; elsewhere it returns None.
+    if not os.path.exists("/proc"):
+        return None
+
+    # Map every process to its children.
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                parent = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+
+    return total
+
+
+def driver_rss(driver):
+    # Return the resident memory of a driver's chromedriver process and its browsers.
+    return process_tree_rss(driver.service.process.pid)
@@ -0,0 +1,53 @@
+import bisect
+
+# Define the number of weekdays in a schedule entry's day bitmask
+DAYS = 7
+
+
+class ConflictIndex:
+    def __init__(self, courses=()):
+        # Index the meetings of a set of courses by weekday, sorted by start time, so a course's conflicts
+        # can be found without comparing it against every meeting of every other course.
+        self.meetings = [[] for _ in range(DAYS)]
+        self.starts = [[] for _ in range(DAYS)]
+        for course in courses:
+            self.add(course)
+
+    def add(self, course):
+        # Add every timed meeting of a course to the index.
+        for entry in course.schedule_entries:
+            if not entry.is_timed():
+                continue
+            for day in range(DAYS):
+                if entry.days >> day & 1:
+                    i = bisect.bisect_right(self.starts[day], entry.start)
+                    self.starts[day].insert(i, entry.start)
+                    self.meetings[day].insert(i, (entry, course))
+
+    def conflicts(self, course, ignore=()):
+        # Return the indexed courses that meet at the same time as the course, as (course, entry) pairs.
+        # Courses with a class number in ignore (e.g. the class a swap drops) are skipped.
+        ignore = {str(number) for number in ignore}
+        found = []
+        for entry in course.schedule_entries:
+            if not entry.is_timed():
+                continue
+            for day in range(DAYS):
+                if not entry.days >> day & 1:
+                    continue
+                # Only meetings that start before this one ends can overlap it.
+                for other_entry, other in self.meetings[day][:bisect.bisect_left(self.starts[day], entry.end)]:
+                    if (other.id == course.id or str(other.class_number) in ignore
+                            or any(other is seen for seen, _ in found)):
+                        continue
+                    if entry.overlaps(other_entry):
+                        found.append((other, other_entry))
+        return found
+
+    def describe(self, course, ignore=()):
+        # Return a reason like "conflicts with CS 106A (MWF 10:30 AM - 11:20 AM)", or None.
+        found = self.conflicts(course, ignore)
+        if not found:
+            return None
+        return "conflicts with " + ", ".join(
+            f"{other.name()} ({entry.days_text} {entry.start_time} - {entry.end_time})" for other, entry in found)
@@ -1,4 +1,83 @@
+import re
+from collections import namedtuple
+from datetime import date, datetime
+
+# Map each Course attribute to the key it comes from in the course snapshot
+COURSE_FIELDS = {
+    "course_title": "courseTitle",
+    "subject": "subject",
+    "course_number": "courseNum",
+    "instructors": "instructors",
+    "is_planned": "isPlanned",
+    "status": "status",
+    "component_code": "componentCode",
+    "career_code": "careerCode",
+    "term": "term",
+    "class_number": "classNbr",
+    "grading_basis": "gradingBasis",
+    "units": "units",
+}
+
+# Map day names and abbreviations to weekday bits (Monday is bit 0)
+DAY_NAMES = {
+    "monday": 0, "mon": 0, "m": 0,
+    "tuesday": 1, "tue": 1, "tues": 1, "tu": 1, "t": 1,
+    "wednesday": 2, "wed": 2, "w": 2,
+    "thursday": 3, "thu": 3, "thur": 3, "thurs": 3, "th": 3, "r": 3,
+    "friday": 4, "fri": 4, "f": 4,
+    "saturday": 5, "sat": 5, "sa": 5, "s": 5,
+    "sunday": 6, "sun": 6, "su": 6, "u": 6,
+}
+
+# Match compact day strings like "MWF" or "TTh", longest abbreviations first
+DAY_LETTERS = re.compile(r"Th|Tu|Sa|Su|M|T|W|R|F|S|U")
+
+# Date formats that schedule entries may use
+DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%b %d, %Y"]
+
+
+def parse_days(text):
+    # Return a bitmask of the weekdays in a days string like "Mon Wed Fri", "Tue, Thu" or "MWF".
+    mask = 0
+    for word in re.findall(r"[A-Za-z]+", text or ""):
+        if word.lower() in DAY_NAMES and len(word) > 1:
+            mask |= 1 << DAY_NAMES[word.lower()]
+        else:
+            for letters in DAY_LETTERS.findall(word):
+                mask |= 1 << DAY_NAMES[letters.lower()]
+    return mask
+
+
+def parse_minutes(text):
+    # Return minutes after midnight for a time like "10:30", "1:30 PM" or "1:30pm", or None.
+    match = re.match(r"\s*(\d{1,2}):(\d{2})\s*([AaPp])?", text or "")
+    if not match:
+        return None
+    hours, minutes, meridiem = int(match.group(1)), int(match.group(2)), match.group(3)
+    if meridiem:
+        hours = hours % 12 + (12 if meridiem.lower() == "p" else 0)
+    return hours * 60 + minutes
+
+
+def parse_date(text):
+    # Return the ordinal of a date in one of DATE_FORMATS, or None.
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime((text or "").strip(), date_format).date().toordinal()
+        except ValueError:
+            continue
+    return None
+
+
+# A change to a course: kind is "added", "removed", "enrolled", "unenrolled", "error" or "updated",
+# fields lists the attributes that changed and old/new hold their previous and current values
+CourseChange = namedtuple("CourseChange", ["course", "kind", "fields", "old", "new"])
+
+
 class ScheduleEntry:
+    __slots__ = ["days_text", "start_date", "end_date", "start_time", "end_time", "room",
+                 "days", "start", "end", "first_day", "last_day"]
+
     def __init__(self, obj):
         self.days_text = obj["daysText"]
         self.start_date = obj["startDate"]
@@ -7,6 +86,35 @@ class ScheduleEntry:
         self.end_time = obj["endTime"]
         self.room = obj["room"]
 
+        # Parse the meeting once into a weekday bitmask, minutes after midnight and date ordinals.
+        # Anything that can't be parsed is left as 0/None and never counts as a conflict.
+        self.days = parse_days(self.days_text)
+        self.start = parse_minutes(self.start_time)
+        self.end = parse_minutes(self.end_time)
+        self.first_day = parse_date(self.start_date) or date.min.toordinal()
+        self.last_day = parse_date(self.end_date) or date.max.toordinal()
+
+    def is_timed(self):
+        # Return True if the entry has known days and a valid time range.
+        return bool(self.days) and self.start is not None and self.end is not None and self.start < self.end
+
+    def overlaps(self, other):
+        # Return True if the two meetings share a weekday, overlap in time and overlap in dates.
+        return (self.is_timed() and other.is_timed() and self.days & other.days
+                and self.start < other.end and other.start < self.end
+                and self.first_day <= other.last_day and other.first_day <= self.last_day)
+
+    @staticmethod
+    def key(obj):
+        # Return the comparable values of a schedule entry snapshot.
+        return (obj["daysText"], obj["startDate"], obj["endDate"], obj["startTime"], obj["endTime"], obj["room"])
+
+    def values(self):
+        return (self.days_text, self.start_date, self.end_date, self.start_time, self.end_time, self.room)
+
+    def __eq__(self, other):
+        return isinstance(other, ScheduleEntry) and self.values() == other.values()
+
     def __str__(self):
         return f"{self.days_text} {self.start_time} - {self.end_time} {self.room}"
 
@@ -15,35 +123,42 @@ class ScheduleEntry:
 
 
 class Course:
+    __slots__ = ["id", "error", "schedule_entries"] + list(COURSE_FIELDS)
+
     def __init__(self, obj):
         self.id = obj["id"]
-        self.course_title = obj["courseTitle"]
-        self.subject = obj["subject"]
-        self.course_number = obj["courseNum"]
-        self.instructors = obj["instructors"]
-        self.is_planned = obj["isPlanned"]
-        self.status = obj["status"]
-        self.component_code = obj["componentCode"]
-        self.career_code = obj["careerCode"]
+        for attribute, key in COURSE_FIELDS.items():
+            setattr(self, attribute, obj.get(key))
         self.schedule_entries = [ScheduleEntry(
             entry) for entry in obj["scheduleEntries"]]
         self.error = None
 
     def update(self, obj):
-        self.id = obj["id"]
-        self.course_title = obj["courseTitle"]
-        self.subject = obj["subject"]
-        self.course_number = obj["courseNum"]
-        self.instructors = obj["instructors"]
-        self.is_planned = obj["isPlanned"]
-        self.status = obj["status"]
-        self.component_code = obj["componentCode"]
-        self.career_code = obj["careerCode"]
-        self.schedule_entries = [ScheduleEntry(
-            entry) for entry in obj["scheduleEntries"]]
-        
+        # Update the course from a snapshot and return {attribute: (old, new)} for the fields that changed.
+        changes = {}
+        for attribute, key in COURSE_FIELDS.items():
+            old, new = getattr(self, attribute), obj.get(key)
+            if old != new:
+                changes[attribute] = (old, new)
+                setattr(self, attribute, new)
+
+        # Only rebuild the schedule entries if they differ.
+        entries = obj["scheduleEntries"]
+        if [e.values() for e in self.schedule_entries] != [ScheduleEntry.key(e) for e in entries]:
+            old = self.schedule_entries
+            self.schedule_entries = [ScheduleEntry(entry) for entry in entries]
+            changes["schedule_entries"] = (old, self.schedule_entries)
+
+        return changes
+
     def get_time(self):
-        return self.schedule_entries[0].start_time + " - " + self.schedule_entries[0].end_time
+        # Return every distinct meeting time, e.g. "MWF 10:30 - 11:20, Th 3:00 - 4:20".
+        times = []
+        for entry in self.schedule_entries:
+            text = f"{entry.days_text} {entry.start_time} - {entry.end_time}".strip()
+            if text not in times:
+                times.append(text)
+        return ", ".join(times)
 
     def name(self):
         return f"{self.subject} {self.course_number}"
@@ -53,3 +168,67 @@ class Course:
 
     def __repr__(self):
         return f"{self.course_title} {self.course_number}"
+
+
+class CourseRegistry:
+    def __init__(self):
+        # Courses keyed by psId, with listeners called for every change.
+        self.courses = {}
+        self.listeners = []
+
+    def subscribe(self, listener):
+        # Call listener(change) for every CourseChange from now on.
+        self.listeners.append(listener)
+
+    def emit(self, course, kind, changes):
+        change = CourseChange(course, kind, list(changes),
+                              {k: v[0] for k, v in changes.items()},
+                              {k: v[1] for k, v in changes.items()})
+        for listener in self.listeners:
+            listener(change)
+        return change
+
+    def update(self, snapshot):
+        # Update the registry from a list of course snapshots and return the changes.
+        events = []
+        seen = set()
+
+        for obj in snapshot:
+            seen.add(obj["id"])
+            course = self.courses.get(obj["id"])
+
+            if course is None:
+                course = self.courses[obj["id"]] = Course(obj)
+                events.append(self.emit(course, "added", {}))
+                continue
+
+            changes = course.update(obj)
+            if not changes:
+                continue
+
+            kind = "updated"
+            if "status" in changes:
+                kind = "enrolled" if course.status == "E" else "unenrolled" if changes["status"][0] == "E" else "updated"
+            events.append(self.emit(course, kind, changes))
+
+        # Remove courses that are no longer in the snapshot.
+        for course_id in [course_id for course_id in self.courses if course_id not in seen]:
+            events.append(self.emit(self.courses.pop(course_id), "removed", {}))
+
+        return events
+
+    def set_error(self, course, error):
+        # Set a course's error, emitting a change only if it is different.
+        if course.error == error:
+            return None
+        old, course.error = course.error, error
+        return self.emit(course, "error", {"error": (old, error)})
+
+    def get(self, course_id):
+        return self.courses.get(course_id)
+
+    def __iter__(self):
+        return iter(list(self.courses.values()))
+
+    def __len__(self):
+        return len(self.courses)
@@ -0,0 +1,275 @@
+import json
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+# Define how often the display loop wakes up to apply events and tick the countdown (in seconds)
+REFRESH_INTERVAL = 1 / 6
+
+
+class Display:
+    # A display that ignores every event, for bots whose state is shown by something else (like the session pool).
+
+    def post(self, kind, **data):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class EventDisplay(Display):
+    def __init__(self):
+        # Show the bot's state from its own thread, so posting an event never waits on the output.
+        #
+        # The bot posts events instead of drawing anything itself:
+        #   status(text)                 the status message changed
+        #   countdown(text, until)       like status, but text contains "{seconds}", the time left until `until`
+        #   attempts(count)              the number of attempts changed
+        #   rows(rows)                   {course id: (name, time, status, info)} for every course
+        self.events = queue.SimpleQueue()
+        self.stopped = threading.Event()
+        self.thread = None
+
+        # The last state seen, so only what actually changed is shown again
+        self.rows = {}
+        self.status = ""
+        self.countdown = None
+        self.attempts = 0
+
+        # What changed while draining the current batch of events
+        self.changed_rows, self.removed_rows = {}, []
+        self.status_changed = self.attempts_changed = False
+
+    def post(self, kind, **data):
+        self.events.put((kind, data))
+
+    def start(self):
+        self.thread = threading.Thread(target=self.loop, name="display", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        # Show the remaining events and stop the display loop.
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+    def loop(self):
+        while True:
+            stopping = self.stopped.is_set()
+            self.drain()
+            self.tick()
+            if stopping:
+                break
+            self.stopped.wait(REFRESH_INTERVAL)
+        self.close()
+
+    def drain(self):
+        # Apply every pending event, then show what changed in one go.
+        self.changed_rows, self.removed_rows = {}, []
+        self.status_changed = self.attempts_changed = False
+
+        while True:
+            try:
+                kind, data = self.events.get_nowait()
+            except queue.Empty:
+                break
+            self.apply(kind, data)
+
+        if self.status_changed and self.countdown is None:
+            self.show_status(self.status)
+        if self.attempts_changed:
+            self.show_attempts(self.attempts)
+        if self.changed_rows or self.removed_rows:
+            self.show_rows(self.changed_rows, self.removed_rows)
+
+    def apply(self, kind, data):
+        # Update the last seen state from one event, noting what changed.
+        if kind == "status":
+            self.status, self.countdown = data["text"], None
+            self.status_changed = True
+        elif kind == "countdown":
+            self.countdown = (data["text"], data["until"])
+            self.status_changed = True
+        elif kind == "attempts":
+            self.attempts_changed = self.attempts != data["count"]
+            self.attempts = data["count"]
+        elif kind == "rows":
+            changed, removed = self.diff_rows(data["rows"])
+            self.changed_rows.update(changed)
+            self.removed_rows.extend(removed)
+
+    def diff_rows(self, rows):
+        # Keep only the rows that differ from what is shown, returning ({course id: row}, [removed row]).
+        changed = {}
+        for course_id, row in rows.items():
+            if self.rows.get(course_id) != row:
+                self.rows[course_id] = changed[course_id] = row
+        removed = []
+        for course_id in [course_id for course_id in self.rows if course_id not in rows]:
+            removed.append(self.rows.pop(course_id))
+            self.changed_rows.pop(course_id, None)
+        return changed, removed
+
+    def tick(self):
+        # Count down without any help from the bot.
+        pass
+
+    def remaining(self):
+        text, until = self.countdown
+        return text.format(seconds=max(0, int(until - time.time())))
+
+    def show_status(self, text):
+        pass
+
+    def show_attempts(self, count):
+        pass
+
+    def show_rows(self, changed, removed):
+        pass
+
+    def close(self):
+        pass
+
+
+class Dashboard(EventDisplay):
+    def __init__(self, title="SimpleEnroll Bot"):
+        # Show the status, attempts and course table in a full screen rich Live view.
+        super().__init__()
+        self.title = title
+        self.live = None
+        self.shown_countdown = None
+
+    def start(self):
+        from rich.live import Live
+
+        self.layout = self.build_layout()
+        self.live = Live(self.layout, auto_refresh=False, screen=True)
+        self.live.start()
+        super().start()
+
+    def build_layout(self):
+        # Create a layout with sub-layouts for title, status, attempts and table.
+        from rich.align import Align
+        from rich.layout import Layout
+        from rich.panel import Panel
+
+        layout = Layout(name="")
+        status_layout = Layout(name="status_panel", size=3)
+        status_layout.split_row(Layout(name="status"),
+                                Layout(name="attempts"))
+        layout.split(Layout(name="Title", size=3),
+                     status_layout, Layout(name="table"))
+
+        layout["Title"].update(
+            Panel(Align(f"[bold green]{self.title}[/bold green]", "center"), expand=True, border_style="green"))
+        layout["status"].update(self.panel("[green]Status:[/] "))
+        layout["attempts"].update(self.panel("[green]Attempts:[/] 0"))
+        layout["table"].update(self.panel(self.build_table()))
+        return layout
+
+    def panel(self, renderable):
+        from rich.panel import Panel
+        return Panel(renderable, border_style="green", expand=True, padding=(0, 1))
+
+    def build_table(self):
+        # Build the course table from the cached rows, sorted by course name.
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold green",
+                      padding=(0, 1), show_lines=True, expand=True)
+        table.add_column("Course", justify="left", max_width=20)
+        table.add_column("Time", justify="left")
+        table.add_column("Status", justify="left")
+        table.add_column("Info", justify="left", max_width=80)
+        for row in sorted(self.rows.values()):
+            table.add_row(*row)
+        return table
+
+    def show_status(self, text):
+        self.layout["status"].update(self.panel(f"[green]Status:[/] {text}"))
+        self.live.refresh()
+
+    def show_attempts(self, count):
+        self.layout["attempts"].update(self.panel(f"[green]Attempts:[/] {count}"))
+        self.live.refresh()
+
+    def show_rows(self, changed, removed):
+        # Rebuild the whole table from the cached rows; this only happens when at least one of them changed.
+        self.layout["table"].update(self.panel(self.build_table()))
+        self.live.refresh()
+
+    def tick(self):
+        # Redraw the countdown once per second while waiting.
+        if self.countdown is None:
+            self.shown_countdown = None
+            return
+        text = self.remaining()
+        if text != self.shown_countdown:
+            self.shown_countdown = text
+            self.show_status(text)
+
+    def close(self):
+        self.live.stop()
+
+
+class JsonStatus(EventDisplay):
+    def __init__(self, account=None, stream=None):
+        # Write one JSON object per line for every change, for running headless under a process manager.
+        super().__init__()
+        self.account = account
+        self.stream = stream or sys.stdout
+
+    def write(self, event, **fields):
+        from rich.text import Text
+
+        # Strip the rich markup used by the dashboard.
+        for key, value in fields.items():
+            if isinstance(value, str):
+                fields[key] = Text.from_markup(value).plain
+
+        line = {"time": datetime.now().isoformat(timespec="seconds"), "event": event}
+        if self.account is not None:
+            line["account"] = self.account
+        line.update(fields)
+
+        self.stream.write(json.dumps(line, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def drain(self):
+        # Every event is written as it comes, in order, so nothing is left to show afterwards.
+        while True:
+            try:
+                kind, data = self.events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "rows":
+                self.show_rows(*self.diff_rows(data["rows"]))
+                continue
+            self.apply(kind, data)
+
+            if kind == "status":
+                self.show_status(self.status)
+            elif kind == "countdown":
+                # A countdown is written once, with the time it ends, instead of every second.
+                self.write("waiting", status=self.remaining(),
+                           until=datetime.fromtimestamp(self.countdown[1]).isoformat(timespec="seconds"))
+            elif kind == "attempts" and self.attempts_changed:
+                self.show_attempts(self.attempts)
+
+    def show_status(self, text):
+        self.write("status", status=text)
+
+    def show_attempts(self, count):
+        self.write("attempts", attempts=count)
+
+    def show_rows(self, changed, removed):
+        for name, schedule, status, info in sorted(changed.values()):
+            self.write("course", course=name, schedule=schedule, status=status, info=info)
+        for name, *_ in removed:
+            self.write("course_removed", course=name)
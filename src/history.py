@@ -0,0 +1,249 @@
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+
+from loguru import logger
+
+# Define the default history database, shared by every account
+DEFAULT_PATH = os.path.join("data", "history.db")
+
+# Define how often queued records are written (in seconds) and the most written in one transaction
+FLUSH_INTERVAL = 2.0
+BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    time REAL NOT NULL,
+    account TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    time REAL NOT NULL,
+    account TEXT NOT NULL,
+    course TEXT NOT NULL,
+    category TEXT,
+    message TEXT
+);
+CREATE TABLE IF NOT EXISTS changes (
+    time REAL NOT NULL,
+    account TEXT NOT NULL,
+    course TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    old_status TEXT,
+    new_status TEXT,
+    fields TEXT
+);
+CREATE TABLE IF NOT EXISTS cycles (
+    time REAL NOT NULL,
+    account TEXT NOT NULL,
+    duration REAL NOT NULL,
+    changed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_course ON results (account, course, time);
+CREATE INDEX IF NOT EXISTS cycles_time ON cycles (account, time);
+"""
+
+# The insert statement for each table
+INSERTS = {
+    "attempts": "INSERT INTO attempts VALUES (?, ?, ?, ?, ?)",
+    "results": "INSERT INTO results VALUES (?, ?, ?, ?, ?)",
+    "changes": "INSERT INTO changes VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "cycles": "INSERT INTO cycles VALUES (?, ?, ?, ?)",
+}
+
+
+def connect(path):
+    # Open the database in WAL mode, so the report can read while the bot writes.
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class HistoryStore:
+    def __init__(self, path=DEFAULT_PATH, flush_interval=FLUSH_INTERVAL):
+        # Record attempts, per-course results, course changes and cycle times in SQLite.
+        #
+        # Recording only puts a row on a queue; a background thread writes the queued rows in batches, so
+        # the enrollment loop never waits on the disk.
+        self.path = path
+        self.flush_interval = flush_interval
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self.write_loop, name="history", daemon=True)
+        self.thread.start()
+
+    def record_attempt(self, account, mode, requests, duration):
+        # An enrollment attempt: mode is "batch" or "plan", requests is the number of requests sent.
+        self.queue.put(("attempts", (time.time(), account, mode, requests, duration)))
+
+    def record_result(self, account, course, category=None, message=None):
+        # The result of one course or plan target in an attempt; category is None if it got no error.
+        self.queue.put(("results", (time.time(), account, course, category, message)))
+
+    def record_change(self, account, change):
+        # A CourseChange from the course registry.
+        old_status = change.old.get("status", change.course.status)
+        new_status = change.new.get("status", change.course.status)
+        fields = json.dumps({field: str(change.new[field]) for field in change.fields if field != "schedule_entries"})
+        self.queue.put(("changes", (time.time(), account, change.course.name(), change.kind,
+                                    old_status, new_status, fields)))
+
+    def record_cycle(self, account, duration, changed):
+        self.queue.put(("cycles", (time.time(), account, duration, int(changed))))
+
+    def write_loop(self):
+        # Write queued rows every flush_interval seconds (or once BATCH_SIZE are waiting) until closed.
+        connection = connect(self.path)
+        closing = False
+        while not closing:
+            rows = defaultdict(list)
+            count = 0
+            deadline = time.monotonic() + self.flush_interval
+            while count < BATCH_SIZE:
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                table, row = item
+                rows[table].append(row)
+                count += 1
+
+            if not count:
+                continue
+            try:
+                with connection:
+                    for table, values in rows.items():
+                        connection.executemany(INSERTS[table], values)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write {count} history records: {e}")
+        connection.close()
+
+    def close(self):
+        # Write everything still queued and stop the writer.
+        self.queue.put(None)
+        self.thread.join(timeout=10)
+
+
+def seat_openings(connection, account=None):
+    # Return (account, course, time) for every time a course stopped being full: a "full" result followed
+    # by a result without an error or with a different one.
+    query = """
+        SELECT account, course, time FROM (
+            SELECT account, course, time, category,
+                   LAG(category) OVER (PARTITION BY account, course ORDER BY time) AS previous
+            FROM results WHERE (? IS NULL OR account = ?)
+        )
+        WHERE previous = 'full' AND (category IS NULL OR category != 'full')
+        ORDER BY time
+    """
+    return connection.execute(query, (account, account)).fetchall()
+
+
+def seats_report(connection, account=None):
+    # Show how often each course's seats opened up, and at which hours and weekdays.
+    from rich.table import Table
+
+    openings = defaultdict(list)
+    for opened_account, course, opened in seat_openings(connection, account):
+        openings[(opened_account, course)].append(datetime.fromtimestamp(opened))
+
+    table = Table(title="Seat openings", show_lines=True)
+    table.add_column("Account")
+    table.add_column("Course")
+    table.add_column("Openings", justify="right")
+    table.add_column("Busiest hours")
+    table.add_column("Busiest days")
+    table.add_column("Last opened")
+    for (opened_account, course), times in sorted(openings.items(), key=lambda item: -len(item[1])):
+        hours = Counter(t.hour for t in times).most_common(3)
+        days = Counter(t.strftime("%a") for t in times).most_common(3)
+        table.add_row(opened_account, course, str(len(times)),
+                      ", ".join(f"{hour:02d}:00 ({n})" for hour, n in hours),
+                      ", ".join(f"{day} ({n})" for day, n in days),
+                      times[-1].strftime("%Y-%m-%d %H:%M:%S"))
+    return table
+
+
+def cycles_report(connection, account=None):
+    # Show how long cycles and attempts took for each account, by hour of the day.
+    from rich.table import Table
+
+    durations = defaultdict(list)
+    changed = Counter()
+    rows = connection.execute("SELECT account, time, duration, changed FROM cycles WHERE (? IS NULL OR account = ?)",
+                              (account, account))
+    for cycle_account, started, duration, cycle_changed in rows:
+        hour = datetime.fromtimestamp(started).hour
+        durations[(cycle_account, hour)].append(duration)
+        changed[(cycle_account, hour)] += cycle_changed
+
+    table = Table(title="Cycle times by hour", show_lines=True)
+    table.add_column("Account")
+    table.add_column("Hour", justify="right")
+    table.add_column("Cycles", justify="right")
+    table.add_column("Changed", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("p90", justify="right")
+    table.add_column("Max", justify="right")
+    for (cycle_account, hour), values in sorted(durations.items()):
+        values.sort()
+        table.add_row(cycle_account, f"{hour:02d}:00", str(len(values)), str(changed[(cycle_account, hour)]),
+                      f"{statistics.median(values):.2f}s", f"{values[int(len(values) * 0.9)]:.2f}s",
+                      f"{values[-1]:.2f}s")
+    return table
+
+
+def changes_report(connection, account=None, limit=50):
+    # Show the latest course status changes.
+    from rich.table import Table
+
+    table = Table(title=f"Last {limit} course changes", show_lines=True)
+    table.add_column("Time")
+    table.add_column("Account")
+    table.add_column("Course")
+    table.add_column("Change")
+    table.add_column("Status")
+    rows = connection.execute(
+        "SELECT time, account, course, kind, old_status, new_status FROM changes "
+        "WHERE (? IS NULL OR account = ?) AND kind != 'added' ORDER BY time DESC LIMIT ?",
+        (account, account, limit)).fetchall()
+    for changed, change_account, course, kind, old_status, new_status in reversed(rows):
+        table.add_row(datetime.fromtimestamp(changed).strftime("%Y-%m-%d %H:%M:%S"), change_account, course, kind,
+                      f"{old_status} → {new_status}" if old_status != new_status else str(new_status))
+    return table
+
+
+# The reports the command line can show
+REPORTS = {"seats": seats_report, "cycles": cycles_report, "changes": changes_report}
+
+
+if __name__ == "__main__":
+    # Show a report from the history database.
+    from rich.console import Console
+
+    parser = argparse.ArgumentParser(description="Report on the Simple Enroll Bot's attempt history")
+    parser.add_argument("report", choices=list(REPORTS), nargs="?", default="seats",
+                        help="seats: when seats opened per course; cycles: cycle times by hour; changes: latest course changes")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="history database to read")
+    parser.add_argument("--account", help="only show this account")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        parser.error(f"No history database at {args.db}")
+
+    connection = sqlite3.connect(args.db)
+    Console().print(REPORTS[args.report](connection, args.account))
@@ -0,0 +1,175 @@
+import http.client
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape
+
+# Placeholders substituted into the captured request body for each request
+REQUEST_TYPE_MARK = "{{SE_REQUEST_TYPE}}"
+PAYLOAD_MARK = "{{SE_PAYLOAD}}"
+
+# Headers that are managed by http.client or the cookie jar and must not be replayed
+SKIPPED_HEADERS = {"host", "content-length", "cookie", "connection"}
+
+
+class SessionExpired(Exception):
+    # Raised when the server answers with a redirect or an auth error instead of a SOAP response.
+    pass
+
+
+class RequestTemplate:
+    def __init__(self, url, method, headers, body):
+        # A captured SE_NetworkEndpoint request with the request type and payload replaced by placeholders.
+        self.url = url
+        self.method = method
+        self.headers = {k: v for k, v in headers.items()
+                        if k.lower() not in SKIPPED_HEADERS}
+        self.body = body
+
+    @classmethod
+    def from_capture(cls, captured, request_type, payload):
+        # Build a template from a request captured in the browser by execute_request.js.
+        body = captured.get("body") or ""
+
+        # The payload may be sent raw or XML-escaped inside a SOAP envelope, so try both.
+        for raw_payload in (payload, escape(payload)):
+            if raw_payload and raw_payload in body:
+                body = body.replace(raw_payload, PAYLOAD_MARK, 1)
+                break
+        else:
+            raise ValueError("Payload not found in captured request body")
+
+        if request_type not in body:
+            raise ValueError("Request type not found in captured request body")
+        body = body.replace(request_type, REQUEST_TYPE_MARK, 1)
+
+        return cls(captured["url"], captured.get("method", "POST"),
+                   captured.get("headers", {}), body)
+
+    def render(self, request_type, payload, escaped):
+        # Fill the placeholders for a new request.
+        if escaped:
+            payload = escape(payload)
+        return self.body.replace(REQUEST_TYPE_MARK, request_type).replace(PAYLOAD_MARK, payload)
+
+
+class HttpEngine:
+    def __init__(self, template, cookies=(), pool_size=4, timeout=15, escaped=False):
+        # Send SE_NetworkEndpoint requests directly over pooled keep-alive HTTP connections.
+        self.template = template
+        self.escaped = escaped
+        self.timeout = timeout
+
+        parts = urlsplit(template.url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path + ("?" + parts.query if parts.query else "")
+
+        # Cookies are keyed by name; the jar is shared by every pooled connection.
+        self.cookies = {}
+        self.cookie_lock = threading.Lock()
+        self.load_cookies(cookies)
+
+        # Keep a bounded pool of idle connections so each attempt reuses an open socket.
+        self.pool = queue.LifoQueue(maxsize=pool_size)
+
+    @classmethod
+    def from_capture(cls, captured, request_type, payload, cookies=(), **kwargs):
+        # Build an engine from a request captured in the browser and the browser's cookies.
+        template = RequestTemplate.from_capture(captured, request_type, payload)
+        escaped = payload not in (captured.get("body") or "")
+        return cls(template, cookies, escaped=escaped, **kwargs)
+
+    def load_cookies(self, cookies):
+        # Import Selenium-style cookie dicts that apply to the endpoint host.
+        with self.cookie_lock:
+            for cookie in cookies:
+                domain = cookie.get("domain", "").lstrip(".")
+                if domain and not (self.host == domain or self.host.endswith("." + domain)):
+                    continue
+                self.cookies[cookie["name"]] = cookie["value"]
+
+    def cookie_header(self):
+        with self.cookie_lock:
+            return "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+
+    def connect(self):
+        # Take an idle connection from the pool or open a new one.
+        try:
+            return self.pool.get_nowait()
+        except queue.Empty:
+            return self.new_connection()
+
+    def new_connection(self):
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def release(self, conn):
+        # Return a connection to the pool, closing it if the pool is already full.
+        try:
+            self.pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def execute(self, request_type, payload):
+        # Send one request and return the response body as text.
+        body = self.template.render(request_type, payload, self.escaped).encode("utf-8")
+        headers = dict(self.template.headers)
+        headers["Cookie"] = self.cookie_header()
+        headers["Connection"] = "keep-alive"
+
+        conn = self.connect()
+        try:
+            try:
+                conn.request(self.template.method, self.path, body=body, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed an idle keep-alive socket, retry once on a fresh one.
+                conn.close()
+                conn = self.new_connection()
+                conn.request(self.template.method, self.path, body=body, headers=headers)
+                response = conn.getresponse()
+            text = response.read().decode("utf-8", errors="replace")
+        except Exception:
+            conn.close()
+            raise
+
+        # Keep any cookies the server rotated.
+        self.store_cookies(response.headers.get_all("Set-Cookie") or [])
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.release(conn)
+
+        # Redirects and auth errors mean the session is gone and the browser needs to log in again.
+        if response.status in (301, 302, 303, 307, 401, 403):
+            raise SessionExpired(f"HTTP {response.status} from {self.host}")
+        if response.status >= 400:
+            raise http.client.HTTPException(f"HTTP {response.status} from {self.host}")
+
+        return text
+
+    def execute_all(self, requests):
+        # Send (request_type, payload) pairs concurrently and return their responses in order.
+        if len(requests) == 1:
+            return [self.execute(*requests[0])]
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            return list(executor.map(lambda r: self.execute(*r), requests))
+
+    def store_cookies(self, set_cookies):
+        with self.cookie_lock:
+            for set_cookie in set_cookies:
+                name, _, rest = set_cookie.partition("=")
+                self.cookies[name.strip()] = rest.split(";", 1)[0]
+
+    def close(self):
+        # Close every idle connection in the pool.
+        while True:
+            try:
+                self.pool.get_nowait().close()
+            except queue.Empty:
+                break
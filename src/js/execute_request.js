@@ -0,0 +1,33 @@
+function executeRequest(requestType, payload, capture, callback) {
+  var serializer = new XMLSerializer();
+
+  // Optionally record the raw XHR that SE_NetworkEndpoint sends so it can be replayed over plain HTTP
+  var captured = { headers: {} };
+  var proto = XMLHttpRequest.prototype;
+  var open = proto.open;
+  var send = proto.send;
+  var setRequestHeader = proto.setRequestHeader;
+
+  if (capture) {
+    proto.open = function (method, url) {
+      captured.method = method;
+      captured.url = new URL(url, location.href).href;
+      return open.apply(this, arguments);
+    };
+    proto.setRequestHeader = function (name, value) {
+      captured.headers[name] = value;
+      return setRequestHeader.apply(this, arguments);
+    };
+    proto.send = function (body) {
+      captured.body = body instanceof Document ? serializer.serializeToString(body) : body == null ? "" : String(body);
+      proto.open = open;
+      proto.send = send;
+      proto.setRequestHeader = setRequestHeader;
+      return send.apply(this, arguments);
+    };
+  }
+
+  SE_NetworkEndpoint.executeRequest(requestType, payload, function (soap_response, status) {
+    callback({ response: serializer.serializeToString(soap_response), request: capture ? captured : null });
+  });
+}
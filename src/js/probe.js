@@ -0,0 +1,11 @@
+var done = arguments[arguments.length - 1];
+
+// Check that the session is still valid without navigating: a logged-in request to the page answers 200,
+// an expired one redirects to the login page
+if (typeof SE_NetworkEndpoint === "undefined") {
+  done(false);
+} else {
+  fetch(location.href, { method: "HEAD", redirect: "manual", credentials: "same-origin", cache: "no-store" })
+    .then((r) => done(r.status === 200))
+    .catch(() => done(false));
+}
@@ -0,0 +1,11 @@
+// Report whether the Simple Enroll page has loaded its course sets and network endpoint
+try {
+  return (
+    typeof SE_NetworkEndpoint !== "undefined" &&
+    typeof SE_NetworkEndpoint.executeRequest === "function" &&
+    Array.isArray(SE_EnrolledCourseSet.prototype.courses) &&
+    Array.isArray(SE_PlannedCourseSet.prototype.courses)
+  );
+} catch (e) {
+  return false;
+}
@@ -0,0 +1,21 @@
+var requests = arguments[0] || [];
+var capture = arguments[1];
+var done = arguments[arguments.length - 1];
+
+// Read both course sets, plus the results of any requests, in a single round trip
+function snapshot(results) {
+  done({
+    enrolled: readCourses(SE_EnrolledCourseSet),
+    planned: readCourses(SE_PlannedCourseSet),
+    results: results,
+  });
+}
+
+// Fire every request at once and wait for all of them to answer
+Promise.all(
+  requests.map((r, i) => {
+    return new Promise((resolve) => {
+      executeRequest(r.type, r.payload, capture && i === 0, resolve);
+    });
+  })
+).then(snapshot);
@@ -0,0 +1,189 @@
+import bisect
+import contextlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from loguru import logger
+
+# Prefix every metric name with the bot's name
+PREFIX = "simple_enroll_"
+
+# Describe each metric as (type, help text) for the Prometheus text format
+METRICS = {
+    "phase_seconds": ("histogram", "Time spent in each phase of a cycle, in seconds."),
+    "attempts_total": ("counter", "Enrollment attempts."),
+    "errors_total": ("counter", "Enrollment errors by category."),
+    "relogins_total": ("counter", "Logins after the session was lost."),
+    "failovers_total": ("counter", "Switches to the standby browser."),
+    "browser_rss_bytes": ("gauge", "Resident memory of chromedriver and its browsers, in bytes."),
+}
+
+# Define the histogram bucket upper bounds (in seconds)
+BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+# A timer that does nothing, returned by a disabled Metrics so instrumented code costs a single call
+NO_TIMER = contextlib.nullcontext()
+
+
+class Histogram:
+    __slots__ = ["counts", "sum", "count"]
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        # Count the value in its own bucket only; buckets are made cumulative when rendered.
+        i = bisect.bisect_left(BUCKETS, value)
+        if i < len(BUCKETS):
+            self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricStore:
+    def __init__(self):
+        # Every sample keyed by (metric name, sorted label items), shared by all bots in the process.
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}
+
+    def render(self):
+        # Return every metric in the Prometheus text exposition format.
+        with self.lock:
+            histograms = {key: (list(h.counts), h.sum, h.count) for key, h in self.histograms.items()}
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+
+        samples = {name: [] for name in METRICS}
+        for (name, labels), (counts, total, count) in histograms.items():
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS, counts):
+                cumulative += bucket
+                samples[name].append((name + "_bucket", labels + (("le", str(bound)),), cumulative))
+            samples[name].append((name + "_bucket", labels + (("le", "+Inf"),), count))
+            samples[name].append((name + "_sum", labels, total))
+            samples[name].append((name + "_count", labels, count))
+        for (name, labels), value in counters.items():
+            samples[name].append((name, labels, value))
+        for (name, labels), function in gauges.items():
+            # Gauges are read when scraped, and skipped if they can't be read.
+            try:
+                value = function()
+            except Exception as e:
+                logger.debug(f"Could not read {name}: {e}")
+                continue
+            if value is not None:
+                samples[name].append((name, labels, value))
+
+        lines = []
+        for name, (kind, description) in METRICS.items():
+            if not samples[name]:
+                continue
+            lines.append(f"# HELP {PREFIX}{name} {description}")
+            lines.append(f"# TYPE {PREFIX}{name} {kind}")
+            for sample, labels, value in samples[name]:
+                label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+                lines.append(f"{PREFIX}{sample}{{{label_text}}} {value}" if labels else f"{PREFIX}{sample} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class Timer:
+    __slots__ = ["metrics", "phase", "start"]
+
+    def __init__(self, metrics, phase):
+        self.metrics = metrics
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.phase, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    def __init__(self, enabled=False, labels=None, store=None):
+        # Record phase timings, counters and gauges for the metrics endpoint. When disabled, every call
+        # returns right away without recording anything.
+        self.enabled = enabled
+        self.labels = tuple(sorted((labels or {}).items()))
+        self.store = store or MetricStore()
+
+    def labeled(self, **labels):
+        # Return a Metrics that adds the given labels (e.g. the account) to everything it records.
+        return Metrics(self.enabled, dict(self.labels, **labels), self.store)
+
+    def key(self, name, labels):
+        return name, tuple(sorted(self.labels + tuple(labels.items())))
+
+    def timer(self, phase):
+        # Return a context manager that records how long its block takes as the given phase.
+        if not self.enabled:
+            return NO_TIMER
+        return Timer(self, phase)
+
+    def observe(self, phase, seconds):
+        if not self.enabled:
+            return
+        key = self.key("phase_seconds", {"phase": phase})
+        with self.store.lock:
+            histogram = self.store.histograms.get(key)
+            if histogram is None:
+                histogram = self.store.histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name, amount=1, **labels):
+        # Add to a counter, e.g. count("errors_total", category="full").
+        if not self.enabled:
+            return
+        key = self.key(name, labels)
+        with self.store.lock:
+            self.store.counters[key] = self.store.counters.get(key, 0) + amount
+
+    def gauge(self, name, function, **labels):
+        # Read a gauge by calling function() whenever the metrics are rendered.
+        if not self.enabled:
+            return
+        with self.store.lock:
+            self.store.gauges[self.key(name, labels)] = function
+
+    def render(self):
+        return self.store.render()
+
+    def serve(self, port, host="127.0.0.1"):
+        # Serve the metrics at http://host:port/metrics from a background thread and return the server.
+        store = self.store
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ["/", "/metrics"]:
+                    self.send_error(404)
+                    return
+                body = store.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("Metrics: " + format % args)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+        logger.info(f"Serving metrics at http://{host}:{server.server_port}/metrics")
+        return server
+
+    def dump(self, path):
+        # Write the metrics to a file, e.g. when the bot exits.
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            f.write(self.render())
+        logger.info(f"Wrote metrics to {path}")
@@ -0,0 +1,44 @@
+import time
+
+from loguru import logger
+
+# Define how long to wait for the page to become ready (in seconds)
+READY_TIMEOUT = 30
+
+# Define how often to poll the page while waiting (in seconds)
+POLL_INTERVAL = 0.1
+
+
+class PageSync:
+    def __init__(self, driver, script, timeout=READY_TIMEOUT):
+        # Wait on the page's own readiness signal instead of sleeping for a fixed time.
+        self.driver = driver
+        self.script = script
+        self.timeout = timeout
+
+    def is_ready(self, driver=None):
+        # Return True once SE_NetworkEndpoint is available and both course sets are populated.
+        return bool((driver or self.driver).execute_script(self.script))
+
+    def wait(self, timeout=None, driver=None):
+        # Block until the page is ready and return how long it took, raising TimeoutException if it never is.
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        start = time.monotonic()
+        WebDriverWait(driver or self.driver, timeout or self.timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: self.is_ready(d))
+        elapsed = time.monotonic() - start
+        logger.debug(f"Page ready after {elapsed:.2f}s")
+        return elapsed
+
+    def reload(self):
+        # Reload the page and wait for it, retrying once with a fresh load if the first one stalls.
+        from selenium.common.exceptions import TimeoutException
+
+        self.driver.refresh()
+        try:
+            return self.wait()
+        except TimeoutException:
+            logger.warning("Page not ready after reload, retrying")
+            self.driver.refresh()
+            return self.wait()
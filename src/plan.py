@@ -0,0 +1,88 @@
+import json
+
+# Define the request types used for single-class enroll, swap and drop-if-enroll requests, and for
+# enrolling in every planned course of a career at once
+EXECUTE_ENROLL = "SE_EXECUTE_ENROLL"
+BATCH_ENROLL = "SE_BATCHENROLL"
+
+# Define the career used when a course or target doesn't name one
+DEFAULT_CAREER = "UG"
+
+# Define the actions a target can take
+ACTIONS = ["enroll", "swap", "drop_if_enroll"]
+
+
+def career_request(career, term=""):
+    # Build the part of a payload that picks the career, and the term if it isn't the one loaded on the page.
+    return f"<Career>{career}</Career>" + (f"<Term>{term}</Term>" if term else "")
+
+
+class Target:
+    def __init__(self, obj):
+        # A single class to enroll in, optionally swapping with or dropping another class on success.
+        self.action = obj.get("action", "enroll")
+        if self.action not in ACTIONS:
+            raise ValueError(f"Unknown action {self.action!r}, expected one of {ACTIONS}")
+
+        self.career = obj.get("career") or DEFAULT_CAREER
+        self.term = obj.get("term") or ""
+        self.class_number = int(obj["class_number"])
+        self.course_id = obj.get("course_id", "")
+        self.grading_basis = obj.get("grading_basis", "")
+        self.units = obj.get("units", "")
+        self.wait_list = "Y" if obj.get("wait_list", False) else "N"
+        self.permission_number = int(obj.get("permission_number", 0))
+
+        # The class to swap out of, or to drop, when the enrollment succeeds.
+        self.other_class_number = int(obj.get("with", 0))
+        if self.action != "enroll" and not self.other_class_number:
+            raise ValueError(f"Action {self.action!r} for class {self.class_number} needs a 'with' class number")
+
+        # The result of the last attempt, filled in by the engine
+        self.error = None
+
+    def to_request(self):
+        # Build the SE_EXECUTE_ENROLL payload for this target.
+        swap_with = self.other_class_number if self.action == "swap" else 0
+        drop_if_enroll = self.other_class_number if self.action == "drop_if_enroll" else 0
+
+        return (
+            career_request(self.career, self.term) +
+            f"<CourseID>{self.course_id}</CourseID>"
+            f"<ClassNumber>{self.class_number}</ClassNumber>"
+            f"<GradingBasis>{self.grading_basis}</GradingBasis>"
+            f"<Units>{self.units}</Units>"
+            f"<WaitList>{self.wait_list}</WaitList>"
+            f"<DropifEnroll>{drop_if_enroll}</DropifEnroll>"
+            f"<PermissionNbr>{self.permission_number}</PermissionNbr>"
+            '<AssociatedClass1 Nbr="0" Taken="" ClassType="" ClassSection=""/>'
+            '<AssociatedClass2 Nbr="0" Taken="" ClassType="" ClassSection=""/>'
+            f"<SwapWithClassNbr>{swap_with}</SwapWithClassNbr>"
+        )
+
+    def name(self):
+        career = f"{self.career} {self.term}" if self.term else self.career
+        if self.action == "enroll":
+            return f"{career} {self.class_number}"
+        return f"{career} {self.class_number} ({self.action.replace('_', ' ')} {self.other_class_number})"
+
+    def __str__(self):
+        return self.name()
+
+    def __repr__(self):
+        return self.name()
+
+
+def load_plan(path):
+    # Load a plan file mapping each career (or "career/term", e.g. "GR/1264") to its list of targets.
+
+    with open(path, "r") as f:
+        plan = json.load(f)
+
+    targets = []
+    for key, entries in plan.items():
+        career, _, term = key.partition("/")
+        for entry in entries:
+            targets.append(Target({"career": career, "term": term, **entry}))
+
+    return targets
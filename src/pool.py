@@ -0,0 +1,177 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+from rich.align import Align
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+
+from browser import SharedService, driver_path, new_driver, process_tree_rss
+
+# Define the default number of accounts that can run an enrollment cycle at the same time
+CONCURRENCY = 2
+
+
+class SessionPool:
+    def __init__(self, accounts, bot_factory, concurrency=CONCURRENCY, profile=False, lean=False, headless=False,
+                 metrics=None):
+        # Run many accounts in one process, sharing a single ChromeDriver service.
+        #
+        # bot_factory(account, driver, data_dir) builds a Bot for one account. Each account gets its own
+        # headless Chrome session (so cookies never leak between accounts) but all of them talk to the
+        # same chromedriver process.
+        self.accounts = accounts
+        self.bot_factory = bot_factory
+        self.concurrency = concurrency
+        self.profile = profile
+        self.lean = lean
+        self.headless = headless
+        self.service = SharedService(driver_path())
+
+        # Report the memory of the shared chromedriver and every account's browser once, without an account label.
+        if metrics is not None:
+            metrics.gauge("browser_rss_bytes", self.browser_rss)
+
+        # Bots by username, with the future of the task each one is currently running
+        self.bots = {}
+        self.running = {}
+        self.errors = {}
+
+        # Accounts whose strike has been started
+        self.struck = set()
+
+    def start_bot(self, account):
+        # Create the account's driver and bot, then log in and load its courses.
+        username = account["username"]
+        data_dir = os.path.join("data", username)
+        driver = new_driver(self.service, os.path.join(data_dir, "profile") if self.profile else None, self.lean)
+        bot = self.bot_factory(account, driver, data_dir)
+        bot.display.start()
+        self.bots[username] = bot
+        bot.start(strike=False)
+
+    def browser_rss(self):
+        # Return the resident memory of the shared chromedriver and its browsers, or None before it starts.
+        process = getattr(self.service, "process", None)
+        return process_tree_rss(process.pid) if process is not None else None
+
+    def cycle_bot(self, bot):
+        # Run one enrollment cycle for an account.
+        bot.cycle()
+
+    def check(self, username):
+        # Collect the result of an account's finished task, keeping the account alive if it failed.
+        future = self.running.pop(username)
+        error = future.exception()
+        if error is None:
+            self.errors.pop(username, None)
+            return
+
+        logger.opt(exception=error).error(f"{username}: {error}")
+        self.errors[username] = str(error).split("\n")[0]
+
+        # Retry failed accounts on their next scheduled attempt.
+        bot = self.bots.get(username)
+        if bot is not None:
+            bot.scheduler.record(False)
+
+    def render(self):
+        # Build a layout with one row of state per account.
+        table = Table(show_header=True, header_style="bold green",
+                      padding=(0, 1), show_lines=True, expand=True)
+        table.add_column("Account", justify="left")
+        table.add_column("Status", justify="left", max_width=60)
+        table.add_column("Attempts", justify="right")
+        table.add_column("Next attempt", justify="left")
+        table.add_column("Enrolled", justify="right")
+        table.add_column("Planned", justify="right")
+
+        for account in self.accounts:
+            username = account["username"]
+            bot = self.bots.get(username)
+            if bot is None:
+                table.add_row(username, "Starting...", "0", "", "", "")
+                continue
+
+            status = getattr(bot, "status", "")
+            if username in self.errors:
+                status = f"[red]Error:[/] {self.errors[username]}"
+            elif username in self.running:
+                status = f"[yellow]{status}[/]"
+
+            next_fire = time.strftime("%H:%M:%S", time.localtime(bot.scheduler.next_fire))
+            enrolled = sum(1 for c in bot.courses if c.status == "E")
+            planned = sum(1 for c in bot.courses if c.is_planned)
+            table.add_row(username, status, str(bot.attempts), next_fire, str(enrolled), str(planned))
+
+        layout = Layout(name="")
+        layout.split(Layout(name="Title", size=3), Layout(name="table"))
+        layout["Title"].update(
+            Panel(Align(f"[bold green]SimpleEnroll Bot[/bold green] - {len(self.accounts)} accounts", "center"),
+                  expand=True, border_style="green"))
+        layout["table"].update(Panel(table, border_style="green", expand=True, padding=(0, 1)))
+        return layout
+
+    def run(self):
+        # Start every account, then keep scheduling their cycles, showing the accounts table unless headless
+        # (each bot then writes its own JSON status lines).
+        if self.headless:
+            self.loop(lambda: None)
+            return
+        with Live(self.render(), refresh_per_second=2, screen=True) as live:
+            self.loop(lambda: live.update(self.render()))
+
+    def loop(self, refresh):
+        # Keep scheduling every account's cycles on a bounded worker pool.
+        #
+        # Strikes run on their own threads instead, one per account, so waiting for a free worker never makes
+        # an account miss the strike window.
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        strikes = ThreadPoolExecutor(max_workers=len(self.accounts) or 1, thread_name_prefix="strike")
+        try:
+            for account in self.accounts:
+                self.running[account["username"]] = executor.submit(self.start_bot, account)
+
+            while True:
+                now = time.time()
+                for username in list(self.running):
+                    if self.running[username].done():
+                        self.check(username)
+
+                # Start the strike of every account that finished logging in, and submit a cycle for every
+                # idle account whose next attempt is due.
+                for username, bot in list(self.bots.items()):
+                    if username in self.running:
+                        continue
+                    if bot.strike_at is not None and username not in self.struck:
+                        self.struck.add(username)
+                        self.running[username] = strikes.submit(bot.fire_strike)
+                    elif bot.scheduler.next_fire <= now:
+                        self.running[username] = executor.submit(self.cycle_bot, bot)
+
+                refresh()
+                time.sleep(0.5)
+
+        except KeyboardInterrupt:
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            strikes.shutdown(wait=False, cancel_futures=True)
+            self.quit()
+
+    def quit(self):
+        # Stop any strike still counting down, then close every account's browser; the shared service stops with
+        # the last one.
+        for bot in self.bots.values():
+            bot.stopped.set()
+        for bot in self.bots.values():
+            try:
+                if bot.http is not None:
+                    bot.http.close()
+                bot.driver.quit()
+                bot.display.stop()
+            except Exception as e:
+                logger.exception(e)
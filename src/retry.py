@@ -0,0 +1,121 @@
+import re
+import time
+
+# Error categories, matched against Simple Enroll error messages in order. Only failures of the wait list
+# itself are waitlist errors (so "wait list is full" is one), while a full class that merely mentions the
+# wait list ("Class X is full. You may add yourself to the wait list.") is a full class.
+WAIT_LIST = r"wait\s*-?\s*list"
+CATEGORIES = [
+    ("waitlist", re.compile(rf"{WAIT_LIST}\s+(is\s+)?(full|closed)|{WAIT_LIST}\s+(limit|capacity)|"
+                            rf"(added|adding)\s+(you\s+)?to\s+the\s+{WAIT_LIST}|already\s+on\s+the\s+{WAIT_LIST}|"
+                            rf"no\s+{WAIT_LIST}", re.IGNORECASE)),
+    ("conflict", re.compile(r"time conflict|conflicts? with|overlap", re.IGNORECASE)),
+    ("prerequisite", re.compile(r"pre-?requisite|requisite|requirement.*not (been )?met|restricted to", re.IGNORECASE)),
+    ("permission", re.compile(r"permission|consent|approval|authoriz", re.IGNORECASE)),
+    ("unit_limit", re.compile(r"unit(s)? (limit|maximum|max)|maximum (number of )?units|exceed.*units|term max", re.IGNORECASE)),
+    ("full", re.compile(r"\bfull\b|no (available )?seats|closed|capacity", re.IGNORECASE)),
+]
+
+# Retry policies: hammer retries every attempt, backoff waits longer after each failure and suppress
+# stops retrying until SUPPRESS_TIME has passed (in case the problem was fixed)
+POLICIES = ["hammer", "backoff", "suppress"]
+
+# Define the default policy for each category
+DEFAULT_POLICIES = {
+    "full": "hammer",
+    "waitlist": "backoff",
+    "conflict": "suppress",
+    "prerequisite": "suppress",
+    "permission": "suppress",
+    "unit_limit": "backoff",
+    "unknown": "backoff",
+}
+
+# Define the backoff timing (in seconds)
+BACKOFF_BASE = 60
+BACKOFF_MAX = 1800
+SUPPRESS_TIME = 3600
+
+
+def classify(message):
+    # Return the category of a Simple Enroll error message.
+    for category, pattern in CATEGORIES:
+        if pattern.search(message or ""):
+            return category
+    return "unknown"
+
+
+class RetryState:
+    __slots__ = ["category", "failures", "next_allowed"]
+
+    def __init__(self):
+        self.category = None
+        self.failures = 0
+        self.next_allowed = 0.0
+
+
+class RetryTracker:
+    def __init__(self, policies=None):
+        # Track each course's (or target's) last error category and when it may be retried.
+        self.policies = dict(DEFAULT_POLICIES, **(policies or {}))
+        self.states = {}
+
+    def policy(self, key):
+        state = self.states.get(key)
+        return self.policies[state.category] if state and state.category else "hammer"
+
+    def category(self, key):
+        state = self.states.get(key)
+        return state.category if state else None
+
+    def eligible(self, key, now=None):
+        # Return True if the course should be part of the next request.
+        state = self.states.get(key)
+        return state is None or (now or time.time()) >= state.next_allowed
+
+    def failure(self, key, message, now=None):
+        # Record a failed attempt and schedule the next one according to the category's policy.
+        now = now or time.time()
+        state = self.states.setdefault(key, RetryState())
+        category = classify(message)
+
+        # A different kind of error starts the backoff over.
+        if category != state.category:
+            state.category = category
+            state.failures = 0
+        state.failures += 1
+
+        policy = self.policies[category]
+        if policy == "hammer":
+            state.next_allowed = now
+        elif policy == "backoff":
+            state.next_allowed = now + min(BACKOFF_BASE * 2 ** (state.failures - 1), BACKOFF_MAX)
+        else:
+            state.next_allowed = now + SUPPRESS_TIME
+
+        return category
+
+    def success(self, key):
+        # Forget everything about a course once it gets through without an error.
+        self.states.pop(key, None)
+
+    def describe(self, key, now=None):
+        # Return a short description like "full" or "prerequisite, suppressed 59m" for the course table.
+        state = self.states.get(key)
+        if state is None or state.category is None:
+            return ""
+        wait = state.next_allowed - (now or time.time())
+        if wait <= 0:
+            return state.category
+        return f"{state.category}, {self.policies[state.category]} {int(wait // 60)}m{int(wait % 60):02d}s"
+
+
+def parse_policies(values):
+    # Parse "category=policy" command line values into a dict.
+    policies = {}
+    for value in values:
+        category, _, policy = value.partition("=")
+        if category not in DEFAULT_POLICIES or policy not in POLICIES:
+            raise ValueError(f"Invalid policy {value!r}, expected <{'|'.join(DEFAULT_POLICIES)}>=<{'|'.join(POLICIES)}>")
+        policies[category] = policy
+    return policies
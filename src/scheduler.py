@@ -0,0 +1,96 @@
+import random
+import time
+from collections import deque
+from datetime import datetime
+
+
+class FixedScheduler:
+    def __init__(self, interval):
+        # Fire every interval seconds, whatever happens.
+        self.interval = interval
+        self.next_fire = time.time()
+
+    def record(self, changed):
+        # Schedule the next attempt after a cycle finishes.
+        self.next_fire = time.time() + self.interval
+
+    def describe(self):
+        return f"every {self.interval:.0f}s"
+
+
+class AdaptiveScheduler:
+    def __init__(self, min_interval=20, max_interval=600, backoff=1.5, jitter=0.2,
+                 max_per_minute=2, burst_times=(), burst_window=300, hourly_window=120):
+        # Poll fast when seats are likely to open and back off when nothing is changing.
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+
+        # Never send more than max_per_minute attempts in any 60 second window.
+        self.max_per_minute = max_per_minute
+        self.history = deque()
+
+        # Burst around configured times (e.g. deadlines) and around the top of every hour.
+        self.burst_times = sorted(t.timestamp() if isinstance(t, datetime) else t
+                                  for t in burst_times)
+        self.burst_window = burst_window
+        self.hourly_window = hourly_window
+
+        self.interval = min_interval
+        self.next_fire = time.time()
+        self.reason = "start"
+
+    def in_burst(self, now):
+        # Return the reason for bursting at the given time, or None.
+        for t in self.burst_times:
+            if abs(now - t) <= self.burst_window:
+                return "deadline"
+
+        seconds_into_hour = now % 3600
+        if seconds_into_hour <= self.hourly_window or 3600 - seconds_into_hour <= self.hourly_window:
+            return "top of hour"
+
+        return None
+
+    def next_burst(self, now):
+        # Return the start of the next burst window after now.
+        starts = [t - self.burst_window for t in self.burst_times if t - self.burst_window > now]
+        starts.append(now - now % 3600 + 3600 - self.hourly_window)
+        return min(starts)
+
+    def record(self, changed):
+        # Schedule the next attempt after a cycle, given whether the course state changed.
+        now = time.time()
+        self.history.append(now)
+        while self.history and self.history[0] < now - 60:
+            self.history.popleft()
+
+        burst = self.in_burst(now)
+        if changed:
+            # Something moved, so come back quickly.
+            self.interval = self.min_interval
+            self.reason = "change"
+        elif burst:
+            self.interval = self.min_interval
+            self.reason = burst
+        else:
+            # Nothing changed, so back off up to the maximum.
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+            self.reason = "backoff"
+
+        delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        next_fire = now + delay
+
+        # Wake up early if a burst window starts before the backed off attempt.
+        if not burst:
+            next_fire = min(next_fire, self.next_burst(now))
+
+        # Respect the rate cap.
+        if len(self.history) >= self.max_per_minute:
+            next_fire = max(next_fire, self.history[-self.max_per_minute] + 60)
+
+        self.next_fire = max(next_fire, now + 1)
+
+    def describe(self):
+        return f"{self.reason}, interval {self.interval:.0f}s"
@@ -0,0 +1,31 @@
+import os
+
+# Define the directory holding the JavaScript files that run inside the Simple Enroll page
+JS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "js")
+
+# Helper files defining functions, followed by the entry points that use them
+LIBRARIES = ["get_course.js", "execute_request.js"]
+ENTRY_POINTS = ["snapshot.js"]
+
+# Standalone scripts that do not need the helper functions
+STANDALONE = ["ready.js", "probe.js"]
+
+
+def load_scripts():
+    # Read every script once and prepend the helper functions to each entry point.
+
+    library = ""
+    for name in LIBRARIES:
+        with open(os.path.join(JS_DIR, name), "r") as f:
+            library += f.read() + "\n"
+
+    scripts = {}
+    for name in ENTRY_POINTS:
+        with open(os.path.join(JS_DIR, name), "r") as f:
+            scripts[name[:-3]] = library + f.read()
+
+    for name in STANDALONE:
+        with open(os.path.join(JS_DIR, name), "r") as f:
+            scripts[name[:-3]] = f.read()
+
+    return scripts
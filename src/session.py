@@ -0,0 +1,50 @@
+import json
+import os
+
+from loguru import logger
+
+# Fields accepted by the Network.setCookies CDP command
+COOKIE_FIELDS = ["name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires"]
+
+
+class SessionStore:
+    def __init__(self, path):
+        # Save and restore every cookie in the browser (Stanford IdP, Duo and Simple Enroll) to a JSON file.
+        self.path = path
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def save(self, driver):
+        # Save all cookies for all domains using the DevTools protocol, since get_cookies only sees the current domain.
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cookies, f)
+
+        logger.debug(f"Saved {len(cookies)} cookies to {self.path}")
+
+    def load(self, driver):
+        # Restore the saved cookies without navigating anywhere. Return True if any were restored.
+        if not self.exists():
+            return False
+
+        with open(self.path, "r") as f:
+            cookies = json.load(f)
+
+        restored = []
+        for cookie in cookies:
+            cookie = {k: v for k, v in cookie.items() if k in COOKIE_FIELDS}
+
+            # Session cookies have no expiry, and invalid sameSite values are rejected.
+            if cookie.get("expires", -1) < 0:
+                cookie.pop("expires", None)
+            if cookie.get("sameSite") not in ["Strict", "Lax", "None"]:
+                cookie.pop("sameSite", None)
+            restored.append(cookie)
+
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": restored})
+        logger.debug(f"Restored {len(restored)} cookies from {self.path}")
+        return bool(restored)
@@ -0,0 +1,94 @@
+import re
+import xml.etree.ElementTree as ET
+
+# Define how much of the response to feed the parser at a time (in characters)
+CHUNK_SIZE = 16384
+
+# Line breaks that Simple Enroll embeds in error messages
+BREAK = re.compile(r"<br\s*/?>", re.IGNORECASE)
+
+
+class SoapResponse:
+    def __init__(self):
+        # Errors and success records from a SE_NetworkEndpoint response, keyed by "SUBJECT NUMBER" (e.g. "CS 106A"),
+        # with errors that name no course under "".
+        self.errors = {}
+        self.successes = {}
+
+    def error(self, subject):
+        return self.errors.get(subject)
+
+    def first_error(self):
+        # Return the first error message, or None if there were no errors.
+        return next(iter(self.errors.values()), None)
+
+    def __bool__(self):
+        return bool(self.errors or self.successes)
+
+
+def local_name(tag):
+    # Strip any XML namespace from a tag.
+    return tag.rsplit("}", 1)[-1]
+
+
+def clean_message(text):
+    # Turn <br> tags into line breaks and trim the whitespace around every line.
+    lines = BREAK.sub("\n", text or "").split("\n")
+    return "\n".join(line.strip() for line in lines if line.strip())
+
+
+def element_text(element):
+    # Return an element's text, turning <br> child elements into line breaks.
+    parts = [element.text or ""]
+    for child in element:
+        if local_name(child.tag).lower() == "br":
+            parts.append("\n")
+        parts.append(element_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def parse_response(xml):
+    # Parse a SOAP response incrementally, keeping only errors and per-course success records.
+    #
+    # Error elements anywhere under an Errors element become errors, keyed by their Subject attribute or ""
+    # without one; any other element with a Subject attribute is a success record. Everything else is discarded as soon as it is parsed.
+    response = SoapResponse()
+    parser = ET.XMLPullParser(events=("start", "end"))
+    errors_depth = 0
+    error_depth = 0
+
+    for i in range(0, len(xml), CHUNK_SIZE):
+        parser.feed(xml[i:i + CHUNK_SIZE])
+        for event, element in parser.read_events():
+            name = local_name(element.tag)
+
+            if event == "start":
+                if name == "Errors":
+                    errors_depth += 1
+                elif name == "Error":
+                    error_depth += 1
+                continue
+
+            if name == "Errors":
+                errors_depth -= 1
+            elif name == "Error":
+                error_depth -= 1
+
+            if errors_depth and name == "Error":
+                # Keep every message for a subject, in order. Errors without a subject (e.g. for the whole
+                # request) are kept under "".
+                subject = element.attrib.get("Subject", "")
+                message = clean_message(element_text(element))
+                previous = response.errors.get(subject)
+                response.errors[subject] = f"{previous}\n{message}" if previous else message
+            elif "Subject" in element.attrib:
+                response.successes[element.attrib["Subject"]] = dict(element.attrib)
+
+            # Everything inside a finished element has been handled, so free it. Elements inside an
+            # error message are kept until the message is read, since clearing them drops their tail text.
+            if not error_depth:
+                element.clear()
+
+    parser.close()
+    return response
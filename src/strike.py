@@ -0,0 +1,62 @@
+import http.client
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Define how far ahead of the target to stop sleeping and start spinning (in seconds)
+SPIN_WINDOW = 0.05
+
+
+def estimate_offset(url, samples=8, timeout=10):
+    # Estimate how far the server clock is ahead of the local clock using response Date headers.
+    #
+    # Date only has one second resolution, but each sample bounds the offset: the server stamped a
+    # time in [date, date + 1) somewhere between sending and receiving. Intersecting the bounds of
+    # several samples, spaced so they land on different fractions of a second, narrows the window.
+
+    parts = urlsplit(url)
+    connection = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = connection(parts.hostname, parts.port, timeout=timeout)
+
+    low, high = float("-inf"), float("inf")
+    try:
+        for i in range(samples):
+            sent = time.time()
+            conn.request("HEAD", parts.path or "/")
+            response = conn.getresponse()
+            received = time.time()
+            response.read()
+
+            date = response.headers.get("Date")
+            if date is None:
+                raise ValueError(f"No Date header from {parts.hostname}")
+            server = parsedate_to_datetime(date).timestamp()
+
+            low = max(low, server - received)
+            high = min(high, server + 1 - sent)
+
+            # Shift the next sample to a different fraction of a second.
+            time.sleep(1 + 1 / samples)
+    finally:
+        conn.close()
+
+    # If the bounds crossed (e.g. the server clock stepped), fall back to the last sample's window.
+    if low > high:
+        low, high = server - received, server + 1 - sent
+
+    return (low + high) / 2, (high - low) / 2
+
+
+def wait_until(target, offset=0.0):
+    # Sleep until the server clock reaches target, spinning for the last few milliseconds.
+    while True:
+        remaining = target - (time.time() + offset)
+        if remaining <= SPIN_WINDOW:
+            break
+        time.sleep(min(remaining - SPIN_WINDOW, 1))
+
+    while time.time() + offset < target:
+        pass
+
+    # Return how late we woke up, in seconds.
+    return time.time() + offset - target
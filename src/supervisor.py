@@ -0,0 +1,136 @@
+import threading
+import time
+
+from loguru import logger
+
+from browser import new_driver
+
+# Define how often to check that the standby browser is still logged in (in seconds)
+KEEPALIVE_INTERVAL = 120
+
+# Define how long to wait before retrying a standby that failed to start (in seconds)
+RETRY_INTERVAL = 30
+
+# Define the longest a failover waits for a check of the standby to finish (in seconds)
+CHECK_TIMEOUT = 10
+
+
+class Supervisor:
+    def __init__(self, bot, driver_factory=new_driver):
+        # Keep a second, already logged in browser warm so the bot can switch to it instantly.
+        self.bot = bot
+        self.driver_factory = driver_factory
+
+        # The standby is only handed to the bot while no check is using it; checked is notified after each check.
+        self.standby = None
+        self.checking = False
+        self.lock = threading.Lock()
+        self.checked = threading.Condition(self.lock)
+        self.stopped = threading.Event()
+        self.wakeup = threading.Event()
+
+    def start(self):
+        # Start building and maintaining the standby browser in the background.
+        threading.Thread(target=self.maintain, name="standby", daemon=True).start()
+
+    def maintain(self):
+        # Build a standby whenever there is none, and keep the existing one logged in.
+        while not self.stopped.is_set():
+            with self.lock:
+                standby = self.standby
+                self.checking = standby is not None
+
+            try:
+                if standby is None:
+                    self.build()
+                elif not self.check(standby):
+                    logger.info("Standby browser lost its session, rebuilding")
+                    self.discard(standby)
+                    self.build()
+            except Exception as e:
+                logger.warning(f"Standby browser failed: {e}")
+                self.sleep(RETRY_INTERVAL)
+                continue
+
+            self.sleep(KEEPALIVE_INTERVAL)
+
+    def check(self, standby):
+        # Return False if the standby logged out, after taking it away so it can be discarded.
+        #
+        # Until the check finishes, failover waits instead of handing the standby to the bot, so only one
+        # thread ever drives it and a failed check never quits the bot's own browser.
+        # A standby that fails the check (e.g. because its Chrome crashed) is rebuilt the same way.
+        try:
+            logged_in = self.bot.is_logged_in(standby)
+        except Exception as e:
+            logger.warning(f"Standby browser check failed: {e}")
+            logged_in = False
+
+        with self.lock:
+            self.checking = False
+            taken = not logged_in and self.standby is standby
+            if taken:
+                self.standby = None
+            self.checked.notify_all()
+        return not taken
+
+    def sleep(self, seconds):
+        # Sleep until the next check, waking early after a failover or when stopped.
+        self.wakeup.wait(seconds)
+        self.wakeup.clear()
+
+    def build(self):
+        # Create a new browser, restore the saved session and log it in, off the critical path.
+        start = time.monotonic()
+        driver = self.driver_factory()
+        try:
+            self.bot.session.load(driver)
+            self.bot.login(driver=driver)
+            self.bot.page.wait(driver=driver)
+        except Exception:
+            self.discard(driver)
+            raise
+
+        with self.lock:
+            if self.standby is not None:
+                self.discard(self.standby)
+            self.standby = driver
+        logger.info(f"Standby browser ready in {time.monotonic() - start:.1f}s")
+
+    def failover(self, reason):
+        # Switch the bot to the standby browser. Return False if no standby is ready.
+        start = time.monotonic()
+        with self.lock:
+            self.checked.wait_for(lambda: not self.checking, CHECK_TIMEOUT)
+            standby = None if self.checking else self.standby
+            if standby is not None:
+                self.standby = None
+        if standby is None:
+            logger.warning(f"No standby browser ready for failover ({reason})")
+            return False
+
+        old = self.bot.driver
+        self.bot.attach(standby)
+        self.bot.metrics.count("failovers_total")
+
+        # Quit the old browser and build the next standby in the background.
+        threading.Thread(target=self.discard, args=(old,), daemon=True).start()
+        self.wakeup.set()
+
+        logger.info(f"Failed over to standby browser in {(time.monotonic() - start) * 1000:.0f} ms ({reason})")
+        return True
+
+    def discard(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Could not quit browser: {e}")
+
+    def stop(self):
+        # Stop the maintenance loop and quit the standby browser.
+        self.stopped.set()
+        self.wakeup.set()
+        with self.lock:
+            standby, self.standby = self.standby, None
+        if standby is not None:
+            self.discard(standby)
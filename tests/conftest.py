@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The bot runs its modules from src (and the benchmarks from bench), so the tests import them the same way
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "bench"))
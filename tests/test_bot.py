@@ -0,0 +1,166 @@
+import datetime
+import threading
+import time
+
+import pytest
+
+import bot as bot_module
+from display import Display
+from mock_server import MockState
+
+
+class FakeDriver:
+    # A webdriver whose page is the mock site's state: the snapshot script reads the course sets as
+    # get_course.js does and fires its requests straight at MockState.
+
+    current_url = bot_module.url
+
+    def __init__(self, state):
+        self.state = state
+        self.requests = []
+
+    def course(self, course):
+        page = course.to_page()
+        page["id"] = page.pop("psId")
+        return page
+
+    def execute_async_script(self, script, *args):
+        if not args:
+            # The session probe
+            return True
+        requests, capture = args
+        self.requests.extend(requests)
+        results = [{"response": self.state.execute(r["type"], r["payload"])} for r in requests]
+        with self.state.lock:
+            courses = list(self.state.courses.values())
+        return {"enrolled": [self.course(c) for c in courses if c.enrolled],
+                "planned": [self.course(c) for c in courses if not c.enrolled],
+                "results": results}
+
+    def execute_script(self, script):
+        # The page readiness check
+        return True
+
+
+@pytest.fixture(autouse=True)
+def no_log_file(monkeypatch):
+    monkeypatch.setattr(bot_module.configure_logging, "done", True, raising=False)
+
+
+def make_bot(state, tmp_path, **kwargs):
+    driver = FakeDriver(state)
+    bot = bot_module.Bot("test", "test", driver=driver, data_dir=str(tmp_path), display=Display(), **kwargs)
+    bot.get_courses()
+    return bot, driver
+
+
+def test_batch_then_individual_requests(tmp_path):
+    state = MockState(enrolled=1, planned=3)
+    bot, driver = make_bot(state, tmp_path, policies={"full": "suppress"})
+
+    # Every planned course is due, so one batch request goes out.
+    assert not bot.attempt()
+    assert [r["type"] for r in driver.requests] == ["SE_BATCHENROLL"]
+    assert all(bot.retry.category(c.id) == "full" for c in bot.courses if c.is_planned)
+
+    # Once one course is due again, only that course is requested, with the page's grading basis and units.
+    course = next(c for c in bot.courses if c.class_number == 10002)
+    bot.retry.success(course.id)
+    state.free_seat(10002)
+    driver.requests.clear()
+    assert bot.attempt()
+    assert [r["type"] for r in driver.requests] == ["SE_EXECUTE_ENROLL"]
+    assert "<ClassNumber>10002</ClassNumber><GradingBasis>GRD</GradingBasis><Units>3</Units>" in \
+        driver.requests[0]["payload"]
+    assert state.courses[10002].enrolled
+
+
+def test_individual_request_error_without_subject(tmp_path):
+    bot, _ = make_bot(MockState(enrolled=1, planned=2), tmp_path)
+    course = next(c for c in bot.courses if c.class_number == 10002)
+
+    # A request-wide error names no course, but it still belongs to the one course the request was for.
+    response = '<STF_SE><Errors><Error Type="E">Your session has timed out.</Error></Errors><Classes/></STF_SE>'
+    assert not bot.batch_results([[course]], [response])
+    assert course.error == "Your session has timed out."
+    assert bot.retry.category(course.id) == "unknown"
+
+
+def test_batch_error_without_subject_applies_to_the_group(tmp_path):
+    bot, _ = make_bot(MockState(enrolled=0, planned=2), tmp_path)
+    planned = [c for c in bot.courses if c.is_planned]
+
+    response = '<STF_SE><Errors><Error Type="E">Enrollment is not open yet.</Error></Errors><Classes/></STF_SE>'
+    assert not bot.batch_results([planned], [response])
+    assert all(bot.retry.category(c.id) == "unknown" for c in planned)
+
+
+def test_nothing_due(tmp_path):
+    bot, driver = make_bot(MockState(enrolled=1, planned=1), tmp_path)
+    course = next(c for c in bot.courses if c.is_planned)
+    bot.retry.failure(course.id, "Instructor consent is required.")
+
+    assert bot.prepare_attempt() is None
+    assert bot.prepare_attempt(force=True).requests[0][0] == "SE_BATCHENROLL"
+
+
+def test_plan_skips_conflicts_and_ineligible_targets(tmp_path):
+    plan = tmp_path / "plan.json"
+    plan.write_text('{"UG": [{"class_number": 10001}, {"class_number": 10002}, {"class_number": 10003}]}')
+    state = MockState(enrolled=1, planned=3)
+    bot, driver = make_bot(state, tmp_path, plan=str(plan))
+
+    # Make 10002 meet at the same time as the enrolled class 10000.
+    state.courses[10002].entry = dict(state.courses[10000].entry)
+    bot.get_courses()
+    bot.retry.failure("UG 10003", "Instructor consent is required.")
+
+    prepared = bot.prepare_attempt()
+    assert prepared.mode == "plan"
+    assert ["<ClassNumber>10001</ClassNumber>" in payload for _, payload in prepared.requests] == [True]
+    assert bot.conflicts["UG 10002"].startswith("conflicts with MOCK 100")
+
+    state.free_seat(10001)
+    assert bot.send_attempt(prepared)
+    assert bot.plan[0].error is None and state.courses[10001].enrolled
+
+    # A strike also fires the target held back for retries, but never the conflicting one.
+    forced = [payload for _, payload in bot.prepare_attempt(force=True).requests]
+    assert ["<ClassNumber>10002</ClassNumber>" in payload for payload in forced] == [False, False]
+    assert any("<ClassNumber>10003</ClassNumber>" in payload for payload in forced)
+
+
+def test_strike_fires_every_retry(tmp_path, monkeypatch):
+    monkeypatch.setattr(bot_module, "estimate_offset", lambda url: (0.0, 0.001))
+    state = MockState(enrolled=1, planned=2)
+    bot, driver = make_bot(state, tmp_path, policies={"full": "suppress"}, strike_retries=2, strike_stagger=0.05,
+                           strike_at=datetime.datetime.fromtimestamp(time.time() + 0.2))
+
+    errors = bot.strike()
+    assert len(errors) == 3 and all(abs(error) < 0.05 for error in errors)
+    assert [r["type"] for r in driver.requests] == ["SE_BATCHENROLL"] * 3
+
+
+def test_stopping_cuts_the_strike_countdown_short(tmp_path, monkeypatch):
+    monkeypatch.setattr(bot_module, "estimate_offset", lambda url: (0.0, 0.001))
+    bot, driver = make_bot(MockState(enrolled=1, planned=1), tmp_path,
+                           strike_at=datetime.datetime.fromtimestamp(time.time() + 3600))
+
+    thread = threading.Thread(target=bot.strike)
+    thread.start()
+    bot.stopped.set()
+    thread.join(2)
+
+    assert not thread.is_alive()
+    assert driver.requests == []
+
+
+def test_invalid_plan_fails_before_chrome_starts(tmp_path, monkeypatch):
+    launched = []
+    monkeypatch.setattr(bot_module, "launch_browser", lambda *args: launched.append(args))
+    plan = tmp_path / "plan.json"
+    plan.write_text('{"UG": [{"class_number": 1, "action": "swap"}]}')
+
+    with pytest.raises(ValueError):
+        bot_module.Bot("test", "test", plan=str(plan), data_dir=str(tmp_path), display=Display())
+    assert launched == []
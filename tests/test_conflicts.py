@@ -0,0 +1,41 @@
+from conflicts import ConflictIndex
+from course import Course
+
+
+def course(class_number, *meetings):
+    # A course meeting at each (days, start, end), with its class number as id and course number.
+    return Course({
+        "id": str(class_number), "subject": "CS", "courseNum": str(class_number), "classNbr": class_number,
+        "scheduleEntries": [{"daysText": days, "startDate": "2026-09-21", "endDate": "2026-12-04",
+                             "startTime": start, "endTime": end, "room": ""} for days, start, end in meetings],
+    })
+
+
+def test_finds_overlapping_courses():
+    enrolled = [course(1, ("MWF", "10:30 AM", "11:20 AM")),
+                course(2, ("TTh", "1:30 PM", "2:50 PM")),
+                course(3, ("F", "3:00 PM", "4:00 PM"))]
+    index = ConflictIndex(enrolled)
+
+    assert [other.id for other, _ in index.conflicts(course(10, ("W", "11:00 AM", "12:00 PM")))] == ["1"]
+    assert [other.id for other, _ in index.conflicts(course(11, ("MWF", "9:00 AM", "4:30 PM")))] == ["1", "3"]
+    assert index.conflicts(course(12, ("MWF", "11:20 AM", "12:10 PM"))) == []
+    assert index.describe(course(13, ("Th", "2:00 PM", "3:00 PM"))) == "conflicts with CS 2 (TTh 1:30 PM - 2:50 PM)"
+    assert index.describe(course(14, ("Sa", "10:00 AM", "11:00 AM"))) is None
+
+
+def test_each_course_reported_once():
+    index = ConflictIndex([course(1, ("MWF", "10:30 AM", "11:20 AM"), ("M", "7:00 PM", "8:00 PM"))])
+    found = index.conflicts(course(10, ("MWF", "10:00 AM", "11:00 AM"), ("M", "7:30 PM", "8:30 PM")))
+    assert [other.id for other, _ in found] == ["1"]
+
+
+def test_ignore_and_self():
+    swapped = course(1, ("MWF", "10:30 AM", "11:20 AM"))
+    index = ConflictIndex([swapped])
+    target = course(10, ("MWF", "10:30 AM", "11:20 AM"))
+
+    assert index.conflicts(swapped) == []
+    assert index.conflicts(target, ignore={1}) == []
+    assert index.conflicts(target, ignore={"1"}) == []
+    assert index.conflicts(target, ignore={2})
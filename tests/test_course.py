@@ -0,0 +1,93 @@
+from datetime import date
+
+import pytest
+
+from course import CourseRegistry, ScheduleEntry, parse_date, parse_days, parse_minutes
+
+
+def entry(days="Mon Wed Fri", start="10:30 AM", end="11:20 AM", first="2026-09-21", last="2026-12-04"):
+    return {"daysText": days, "startDate": first, "endDate": last, "startTime": start, "endTime": end,
+            "room": "Room 1"}
+
+
+def snapshot(course_id, status="P", **fields):
+    return {"id": course_id, "courseTitle": "Course", "subject": "CS", "courseNum": course_id,
+            "isPlanned": status != "E", "status": status, "classNbr": int(course_id),
+            "scheduleEntries": [entry()], **fields}
+
+
+@pytest.mark.parametrize("text, days", [
+    ("Mon Wed Fri", 0b10101),
+    ("Tue, Thu", 0b01010),
+    ("MWF", 0b10101),
+    ("TTh", 0b01010),
+    ("Saturday", 0b100000),
+    ("", 0),
+    (None, 0),
+])
+def test_parse_days(text, days):
+    assert parse_days(text) == days
+
+
+@pytest.mark.parametrize("text, minutes", [
+    ("10:30", 630),
+    ("1:30 PM", 810),
+    ("1:30pm", 810),
+    ("12:00 AM", 0),
+    ("12:15 PM", 735),
+    ("TBA", None),
+])
+def test_parse_minutes(text, minutes):
+    assert parse_minutes(text) == minutes
+
+
+def test_parse_date():
+    ordinal = date(2026, 9, 21).toordinal()
+    assert parse_date("2026-09-21") == ordinal
+    assert parse_date("09/21/2026") == ordinal
+    assert parse_date("Sep 21, 2026") == ordinal
+    assert parse_date("someday") is None
+
+
+def test_overlaps():
+    morning = ScheduleEntry(entry())
+    assert morning.overlaps(ScheduleEntry(entry(days="W", start="11:00 AM", end="11:50 AM")))
+    assert not morning.overlaps(ScheduleEntry(entry(start="11:20 AM", end="12:10 PM")))
+    assert not morning.overlaps(ScheduleEntry(entry(days="Tue Thu")))
+    assert not morning.overlaps(ScheduleEntry(entry(first="2027-01-04", last="2027-03-12")))
+    assert not morning.overlaps(ScheduleEntry(entry(start="TBA", end="TBA")))
+
+
+def test_registry_changes():
+    registry = CourseRegistry()
+    changes = []
+    registry.subscribe(changes.append)
+
+    registry.update([snapshot("1"), snapshot("2")])
+    assert [change.kind for change in changes] == ["added", "added"]
+
+    changes.clear()
+    assert registry.update([snapshot("1"), snapshot("2")]) == []
+
+    registry.update([snapshot("1", status="E")])
+    assert [(change.course.id, change.kind) for change in changes] == [("1", "enrolled"), ("2", "removed")]
+    assert changes[0].old["status"] == "P" and changes[0].new["status"] == "E"
+
+    changes.clear()
+    course = registry.get("1")
+    registry.set_error(course, "Class CS 1 is full.")
+    assert registry.set_error(course, "Class CS 1 is full.") is None
+    assert [change.kind for change in changes] == ["error"]
+    assert len(registry) == 1
+
+
+def test_schedule_changes_rebuild_entries():
+    registry = CourseRegistry()
+    registry.update([snapshot("1")])
+    course = registry.get("1")
+    entries = course.schedule_entries
+
+    changes = registry.update([snapshot("1", scheduleEntries=[entry(days="Tue Thu")])])
+    assert changes[0].fields == ["schedule_entries"]
+    assert course.schedule_entries is not entries
+    assert course.get_time() == "Tue Thu 10:30 AM - 11:20 AM"
@@ -0,0 +1,85 @@
+import pytest
+
+from http_engine import HttpEngine, RequestTemplate, SessionExpired
+from mock_server import ENDPOINT_PATH, SESSION_COOKIE, MockServer, MockState
+from plan import BATCH_ENROLL, EXECUTE_ENROLL, Target, career_request
+from soap import parse_response
+
+
+def capture(server, request_type, payload):
+    # A request as execute_request.js captures it from the mock page's XHR, with the payload XML-escaped.
+    escaped = payload.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return {
+        "url": server.url(ENDPOINT_PATH),
+        "method": "POST",
+        "headers": {"Content-Type": "text/xml; charset=utf-8", "Cookie": "dropped", "Host": "dropped"},
+        "body": ('<?xml version="1.0" encoding="UTF-8"?><Envelope><Body><Request>'
+                 f"<RequestType>{request_type}</RequestType><Payload>{escaped}</Payload>"
+                 "</Request></Body></Envelope>"),
+    }
+
+
+@pytest.fixture
+def server():
+    with MockServer(MockState(enrolled=2, planned=3)) as server:
+        yield server
+
+
+@pytest.fixture
+def engine(server):
+    # An engine built from a captured batch request, with a logged in session's cookie.
+    cookies = [{"name": SESSION_COOKIE, "value": server.state.new_session(), "domain": "127.0.0.1"},
+               {"name": "other", "value": "x", "domain": "example.com"}]
+    engine = HttpEngine.from_capture(capture(server, BATCH_ENROLL, career_request("UG")), BATCH_ENROLL,
+                                     career_request("UG"), cookies)
+    yield engine
+    engine.close()
+
+
+def test_template_from_capture(server):
+    payload = career_request("UG")
+    template = RequestTemplate.from_capture(capture(server, BATCH_ENROLL, payload), BATCH_ENROLL, payload)
+    assert "Cookie" not in template.headers and "Host" not in template.headers
+    assert template.render(EXECUTE_ENROLL, "<A>&</A>", escaped=True).count("&lt;A&gt;&amp;&lt;/A&gt;") == 1
+
+    with pytest.raises(ValueError):
+        RequestTemplate.from_capture(capture(server, BATCH_ENROLL, payload), BATCH_ENROLL, "<Career>GR</Career>")
+
+
+def test_batch_enroll(server, engine):
+    assert engine.escaped
+    assert engine.cookies.keys() == {SESSION_COOKIE}
+
+    response = parse_response(engine.execute(BATCH_ENROLL, career_request("UG")))
+    assert sorted(response.errors) == ["MOCK 102", "MOCK 103", "MOCK 104"]
+    assert all(message.startswith(f"Class {name} is full.") for name, message in response.errors.items())
+
+
+def test_concurrent_requests_reuse_connections(server, engine):
+    server.state.free_seat(10003)
+    targets = [Target({"class_number": n}) for n in (10002, 10003, 10004)]
+    results = engine.execute_all([(EXECUTE_ENROLL, target.to_request()) for target in targets])
+
+    responses = [parse_response(result) for result in results]
+    assert [response.first_error() is None for response in responses] == [False, True, False]
+    assert "MOCK 103" in responses[1].successes
+    assert server.state.courses[10003].enrolled
+
+    # Every connection went back to the pool for the next attempt.
+    assert engine.pool.qsize() == 3
+    engine.execute_all([(EXECUTE_ENROLL, targets[0].to_request())])
+    assert engine.pool.qsize() == 3
+
+
+def test_unknown_class(engine):
+    response = parse_response(engine.execute(EXECUTE_ENROLL, Target({"class_number": 1}).to_request()))
+    assert response.first_error() == "Class not found."
+
+
+def test_session_expired(server, engine):
+    server.state.expire_sessions()
+    with pytest.raises(SessionExpired):
+        engine.execute(BATCH_ENROLL, career_request("UG"))
+
+    engine.load_cookies([{"name": SESSION_COOKIE, "value": server.state.new_session()}])
+    assert parse_response(engine.execute(BATCH_ENROLL, career_request("UG"))).errors
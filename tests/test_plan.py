@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from plan import DEFAULT_CAREER, Target, career_request, load_plan
+
+
+def test_career_request():
+    assert career_request("UG") == "<Career>UG</Career>"
+    assert career_request("GR", "1264") == "<Career>GR</Career><Term>1264</Term>"
+
+
+def test_target_request():
+    target = Target({"class_number": "9310", "grading_basis": "RLT", "units": 5, "action": "swap", "with": 15126})
+    request = target.to_request()
+    assert request.startswith(f"<Career>{DEFAULT_CAREER}</Career><CourseID></CourseID>")
+    assert "<ClassNumber>9310</ClassNumber>" in request
+    assert "<GradingBasis>RLT</GradingBasis><Units>5</Units><WaitList>N</WaitList>" in request
+    assert "<DropifEnroll>0</DropifEnroll>" in request
+    assert "<SwapWithClassNbr>15126</SwapWithClassNbr>" in request
+    assert target.name() == "UG 9310 (swap 15126)"
+
+
+def test_drop_if_enroll():
+    target = Target({"career": "GR", "term": "1264", "class_number": 1, "action": "drop_if_enroll", "with": 2})
+    request = target.to_request()
+    assert request.startswith("<Career>GR</Career><Term>1264</Term>")
+    assert "<DropifEnroll>2</DropifEnroll>" in request and "<SwapWithClassNbr>0</SwapWithClassNbr>" in request
+    assert str(target) == "GR 1264 1 (drop if enroll 2)"
+
+
+def test_invalid_targets():
+    with pytest.raises(ValueError):
+        Target({"class_number": 1, "action": "waitlist"})
+    with pytest.raises(ValueError):
+        Target({"class_number": 1, "action": "swap"})
+
+
+def test_load_plan(tmp_path):
+    path = tmp_path / "plan.json"
+    path.write_text(json.dumps({"UG": [{"class_number": 1}], "GR/1264": [{"class_number": 2, "wait_list": True}]}))
+    targets = load_plan(path)
+    assert [(t.career, t.term, t.class_number) for t in targets] == [("UG", "", 1), ("GR", "1264", 2)]
+    assert "<WaitList>Y</WaitList>" in targets[1].to_request()
@@ -0,0 +1,54 @@
+import pytest
+
+from retry import BACKOFF_BASE, SUPPRESS_TIME, RetryTracker, classify, parse_policies
+
+
+@pytest.mark.parametrize("message, category", [
+    ("Class CS 106A is full.<br>You may add yourself to the wait list.", "full"),
+    ("Class CS 106A is full. You may add yourself to the wait list.", "full"),
+    ("This class is closed.", "full"),
+    ("There are no available seats for this class.", "full"),
+    ("The wait list is full.", "waitlist"),
+    ("Wait list limit reached for CS 106A.", "waitlist"),
+    ("You have been added to the wait list for CS 106A.", "waitlist"),
+    ("You are already on the waitlist for this class.", "waitlist"),
+    ("This class has a time conflict with MATH 51.", "conflict"),
+    ("Enrollment requirements have not been met.", "prerequisite"),
+    ("Instructor consent is required.", "permission"),
+    ("You would exceed the maximum number of units allowed.", "unit_limit"),
+    ("Something unexpected happened.", "unknown"),
+    (None, "unknown"),
+])
+def test_classify(message, category):
+    assert classify(message) == category
+
+
+def test_full_is_hammered():
+    tracker = RetryTracker()
+    assert tracker.failure("1", "Class CS 106A is full.<br>You may add yourself to the wait list.", now=100) == "full"
+    assert tracker.policy("1") == "hammer"
+    assert tracker.eligible("1", now=100)
+
+
+def test_backoff_doubles_and_success_resets():
+    tracker = RetryTracker()
+    tracker.failure("1", "Something unexpected happened.", now=100)
+    assert not tracker.eligible("1", now=100 + BACKOFF_BASE - 1)
+    assert tracker.eligible("1", now=100 + BACKOFF_BASE)
+    tracker.failure("1", "Something unexpected happened.", now=200)
+    assert not tracker.eligible("1", now=200 + BACKOFF_BASE)
+    assert tracker.eligible("1", now=200 + 2 * BACKOFF_BASE)
+
+    tracker.success("1")
+    assert tracker.category("1") is None
+    assert tracker.eligible("1", now=0)
+
+
+def test_suppress_and_overrides():
+    tracker = RetryTracker(parse_policies(["waitlist=suppress"]))
+    tracker.failure("1", "The wait list is full.", now=100)
+    assert tracker.describe("1", now=100).startswith("waitlist, suppress")
+    assert tracker.eligible("1", now=100 + SUPPRESS_TIME)
+
+    with pytest.raises(ValueError):
+        parse_policies(["full=forever"])
@@ -0,0 +1,63 @@
+import pytest
+
+import scheduler
+from scheduler import AdaptiveScheduler, FixedScheduler
+
+# A time in the middle of an hour, away from the hourly burst windows
+NOW = 1_800_000_000 + 1800
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Freeze the scheduler's clock at NOW, movable through clock.now.
+    class Clock:
+        now = NOW
+
+    monkeypatch.setattr(scheduler.time, "time", lambda: Clock.now)
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: 1.0)
+    return Clock
+
+
+def test_fixed(clock):
+    fixed = FixedScheduler(300)
+    fixed.record(True)
+    assert fixed.next_fire == NOW + 300
+    assert fixed.describe() == "every 300s"
+
+
+def test_backs_off_and_resets_on_change(clock):
+    adaptive = AdaptiveScheduler(min_interval=20, max_interval=100, backoff=2, max_per_minute=100)
+    intervals = []
+    for _ in range(5):
+        adaptive.record(False)
+        intervals.append(adaptive.interval)
+    assert intervals == [40, 80, 100, 100, 100]
+    assert adaptive.reason == "backoff"
+
+    adaptive.record(True)
+    assert adaptive.interval == 20 and adaptive.next_fire == NOW + 20
+
+
+def test_bursts(clock):
+    adaptive = AdaptiveScheduler(min_interval=20, max_interval=1000, backoff=10, max_per_minute=100,
+                                 burst_times=[NOW + 1000], burst_window=300)
+    adaptive.record(False)
+    # Backing off to 1000s would skip the start of the deadline burst, so it wakes up for it instead.
+    adaptive.record(False)
+    assert adaptive.next_fire == NOW + 700
+
+    clock.now = NOW + 900
+    adaptive.record(False)
+    assert adaptive.reason == "deadline" and adaptive.interval == 20
+
+    clock.now = NOW + 1800 - 60
+    adaptive.record(False)
+    assert adaptive.reason == "top of hour"
+
+
+def test_rate_cap(clock):
+    adaptive = AdaptiveScheduler(min_interval=1, max_per_minute=2)
+    adaptive.record(True)
+    clock.now = NOW + 1
+    adaptive.record(True)
+    assert adaptive.next_fire == NOW + 60
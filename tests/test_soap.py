@@ -0,0 +1,40 @@
+from soap import CHUNK_SIZE, parse_response
+
+RESPONSE = (
+    '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"><soap:Body><STF_SE>'
+    '<Errors>'
+    '<Error Subject="CS 106A" Type="E">Class CS 106A is full.&lt;br&gt;You may add yourself to the wait list.</Error>'
+    '<Error Subject="CS 106A" Type="E">  Second<br/>message  </Error>'
+    '</Errors>'
+    '<Classes><Class Subject="MATH 51" ClassNbr="1234" Status="E"/></Classes>'
+    '</STF_SE></soap:Body></soap:Envelope>'
+)
+
+
+def test_errors_and_successes():
+    response = parse_response(RESPONSE)
+    assert response.error("CS 106A") == "Class CS 106A is full.\nYou may add yourself to the wait list.\nSecond\nmessage"
+    assert response.successes["MATH 51"]["ClassNbr"] == "1234"
+    assert response.first_error().startswith("Class CS 106A is full.")
+    assert response
+
+
+def test_error_without_subject():
+    response = parse_response('<STF_SE><Errors><Error Type="E">Your session has timed out.</Error></Errors>'
+                              '<Classes/></STF_SE>')
+    assert response.errors == {"": "Your session has timed out."}
+    assert response.first_error() == "Your session has timed out."
+
+
+def test_empty_response():
+    response = parse_response("<STF_SE><Errors/><Classes/></STF_SE>")
+    assert not response
+    assert response.first_error() is None
+
+
+def test_large_response_in_chunks():
+    classes = "".join(f'<Class Subject="CS {i}" ClassNbr="{i}"/>' for i in range(CHUNK_SIZE // 20))
+    response = parse_response(f'<STF_SE><Errors><Error Subject="CS 0">Full</Error></Errors>'
+                              f'<Classes>{classes}</Classes></STF_SE>')
+    assert len(response.successes) == CHUNK_SIZE // 20
+    assert response.errors == {"CS 0": "Full"}
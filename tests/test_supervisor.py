@@ -0,0 +1,88 @@
+import threading
+
+from metrics import Metrics
+from supervisor import Supervisor
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeBot:
+    def __init__(self, logged_in=True):
+        # is_logged_in blocks until release is set, so a failover can be started during the check.
+        self.logged_in = logged_in
+        self.checking = threading.Event()
+        self.release = threading.Event()
+        self.driver = FakeDriver()
+        self.metrics = Metrics()
+
+    def is_logged_in(self, driver=None):
+        self.checking.set()
+        self.release.wait(5)
+        return self.logged_in
+
+    def attach(self, driver):
+        self.driver = driver
+
+
+def start_check(supervisor, standby):
+    supervisor.standby = standby
+    supervisor.checking = True
+    result = []
+    thread = threading.Thread(target=lambda: result.append(supervisor.check(standby)))
+    thread.start()
+    supervisor.bot.checking.wait(5)
+    return thread, result
+
+
+def test_failover_waits_for_check():
+    bot = FakeBot(logged_in=True)
+    supervisor = Supervisor(bot, driver_factory=FakeDriver)
+    standby = FakeDriver()
+    thread, result = start_check(supervisor, standby)
+
+    threading.Timer(0.1, bot.release.set).start()
+    assert supervisor.failover("test")
+    thread.join(5)
+
+    assert result == [True]
+    assert bot.driver is standby and supervisor.standby is None
+    assert not standby.quit_called
+
+
+def test_logged_out_standby_is_never_handed_over():
+    bot = FakeBot(logged_in=False)
+    supervisor = Supervisor(bot, driver_factory=FakeDriver)
+    standby = FakeDriver()
+    thread, result = start_check(supervisor, standby)
+
+    threading.Timer(0.1, bot.release.set).start()
+    assert not supervisor.failover("test")
+    thread.join(5)
+
+    assert result == [False]
+    assert bot.driver is not standby and supervisor.standby is None
+
+
+def test_crashed_standby_is_rebuilt():
+    class CrashedBot(FakeBot):
+        def is_logged_in(self, driver=None):
+            raise RuntimeError("chrome not reachable")
+
+    bot = CrashedBot()
+    supervisor = Supervisor(bot, driver_factory=FakeDriver)
+    crashed = FakeDriver()
+    supervisor.standby = crashed
+
+    built = []
+    supervisor.build = lambda: built.append(True)
+    supervisor.sleep = lambda seconds: supervisor.stopped.set()
+    supervisor.maintain()
+
+    assert built == [True] and crashed.quit_called
+    assert not supervisor.failover("test")